@@ -2,9 +2,9 @@
 import os
 import io
 import shutil
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
-from dash import Dash, html, dcc, Output, Input, State, MATCH, callback, no_update
+from dash import Dash, html, dcc, dash_table, Output, Input, State, MATCH, callback, no_update
 import dash_bootstrap_components as dbc
 
 # =========================================================
@@ -29,9 +29,13 @@ server = app.server  # για Plesk/Passenger
 # -----------------------------
 # ΔΙΚΕΣ ΣΟΥ ΒΙΒΛΙΟΘΗΚΕΣ deadlines
 # -----------------------------
-from deadlines import DeadlineCalculator
-from deadlines.rules import RuleContext
+from deadlines.rules import RuleContext, RULE_SETS, rule_set_for
+from deadlines.utils import day_format, parse_iso_date
 from deadlines.pdf import GREEK_FONT_PATH
+from deadlines.store import CaseStore, CaseRecord, make_case_key, DOCKET_OPERATORS
+from deadlines.planner import filing_window, step_deadline
+from deadlines.search import attach_to_store
+from deadlines.warmup import compute_cached
 
 # ==========================
 #  Utils
@@ -64,18 +68,50 @@ def ensure_greek_font_available():
     except Exception:
         pass
 
-WEEKDAYS_GR = ["Δευτέρα","Τρίτη","Τετάρτη","Πέμπτη","Παρασκευή","Σάββατο","Κυριακή"]
-
-def weekday_gr(dt: date) -> str:
-    return WEEKDAYS_GR[dt.weekday()]
+def shown_deadlines(all_rows: list) -> list:
+    """Οι προθεσμίες που εμφανίζονται/αποθηκεύονται: χωρίς τις 2 τελευταίες (επί παρεμπιπτουσών)."""
+    return all_rows[:-2] if len(all_rows) >= 2 else all_rows
 
 def next_monday(d: date) -> date:
     while d.weekday() >= 5:  # 5=Σ, 6=Κ
         d += timedelta(days=1)
     return d
 
-def parse_date_str(s: str) -> date:
-    return datetime.strptime(s, "%Y-%m-%d").date()
+DOCKET_DATE_COLUMNS = ("filing_date", "deadline")
+
+def _dmy_to_iso(value: str) -> str:
+    """Οι ημερομηνίες του docket εμφανίζονται ως DD-MM-YYYY· φίλτρο «07-2025» ή «15-07-2025» → ISO."""
+    parts = value.split("-")
+    if len(parts) > 1 and len(parts[-1]) == 4 and len(parts[0]) <= 2 and all(p.isdigit() for p in parts):
+        return "-".join(reversed(parts))
+    return value
+
+def split_filter_query(filter_query: str) -> list:
+    """Μετατρέπει το filter_query του DataTable (π.χ. `{client} contains Παπ && {step} = 2`)
+    σε [(στήλη, τελεστής, τιμή)] για το CaseStore.docket_page."""
+    aliases = {"eq":"=", "ne":"!=", "lt":"<", "le":"<=", "gt":">", "ge":">=",
+               "icontains":"contains", "s=":"="}
+    ops = {**{op: op for op in DOCKET_OPERATORS}, **aliases}
+    out = []
+    for part in (filter_query or "").split(" && "):
+        part = part.strip()
+        if not part.startswith("{") or "}" not in part:
+            continue
+        col, rest = part[1:].split("}", 1)
+        rest = rest.strip()
+        for tok in sorted(ops, key=len, reverse=True):
+            if rest.startswith(tok + " "):
+                op = ops[tok]
+                value = rest[len(tok):].strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'`":
+                    value = value[1:-1]
+                if col in DOCKET_DATE_COLUMNS:
+                    value = _dmy_to_iso(value)
+                elif value.lstrip("-").isdigit():
+                    value = int(value)
+                out.append((col, op, value))
+                break
+    return out
 
 # -----------------------------
 # Creative CSS -> assets/inline.css
@@ -159,6 +195,25 @@ def ensure_assets_css():
 ensure_greek_font_available()
 ensure_assets_css()
 
+case_store = CaseStore()
+# Ευρετήριο αναζήτησης πελάτη/αντιδίκου (στη μνήμη κάθε worker· συγχρονίζεται και με τις
+# αποθηκεύσεις των άλλων workers από το ημερολόγιο αλλαγών της βάσης)
+case_index = attach_to_store(case_store)
+
+# Υπενθυμίσεις (προαιρετικά): ασφαλές με πολλούς workers — τις στέλνει μόνο όποιος πάρει το lock
+# της βάσης, ενώ οι αποθηκεύσεις των άλλων workers διαβάζονται από το ημερολόγιο αλλαγών
+if os.environ.get("DEADLINES_REMINDER_MAILDIR") or os.environ.get("DEADLINES_REMINDER_WEBHOOK"):
+    from deadlines.reminders import MaildirSink, WebhookSink, start_in_background
+    _sink = (MaildirSink(os.environ["DEADLINES_REMINDER_MAILDIR"]) if os.environ.get("DEADLINES_REMINDER_MAILDIR")
+             else WebhookSink(os.environ["DEADLINES_REMINDER_WEBHOOK"]))
+    reminder_scheduler = start_in_background(case_store, _sink, int(os.environ.get("DEADLINES_REMINDER_LEAD_DAYS", "3")))
+
+# Προθέρμανση (προαιρετικά): DEADLINES_WARMUP_DAYS=365 → cache για ±365 ημέρες από σήμερα,
+# σε background thread ώστε ο worker να δέχεται αιτήματα αμέσως
+if os.environ.get("DEADLINES_WARMUP_DAYS"):
+    from deadlines.warmup import start_in_background as start_warmup
+    warmup_report = start_warmup(int(os.environ["DEADLINES_WARMUP_DAYS"]))
+
 # ==========================
 #  Layout
 # ==========================
@@ -197,7 +252,7 @@ controls_card = dbc.Card(
                 dcc.DatePickerSingle(
                     id="in-filing-date",
                     display_format="DD/MM/YYYY",
-                    date=date.today().strftime("%Y-%m-%d"),
+                    date=day_format(date.today()).iso,
                 ),
                 html.Div(id="filing-note", className="text-secondary mt-1", style={"fontSize":"0.95rem"})
             ], md=6),
@@ -214,8 +269,11 @@ controls_card = dbc.Card(
         ], className="g-2"),
         dbc.Row([
             dbc.Col(dbc.Button("Αποθήκευση PDF", id="btn-pdf",
-                               color="secondary", className="w-100 mt-2"), md=12),
+                               color="secondary", className="w-100 mt-2"), md=6),
+            dbc.Col(dbc.Button("Αποθήκευση υπόθεσης", id="btn-save-case",
+                               color="secondary", outline=True, className="w-100 mt-2"), md=6),
         ]),
+        html.Div(id="save-case-message", className="text-success mt-2", style={"fontSize":"0.95rem"}),
     ]),
     className="card-clean"
 )
@@ -233,15 +291,104 @@ results_card = dbc.Card(
     className="card-clean"
 )
 
+def next_august_eve(today: date) -> date:
+    y = today.year if today < date(today.year, 7, 31) else today.year + 1
+    return date(y, 7, 31)
+
+planner_card = dbc.Card(
+    dbc.CardBody([
+        html.Div("🗓️ Σχεδιασμός κατάθεσης", className="h5 mb-3"),
+        html.Div("Με τις ρυθμίσεις 1–3: ποιες ημερομηνίες κατάθεσης κρατούν την προθεσμία εντός ορίων;",
+                 className="text-secondary mb-2", style={"fontSize":"0.95rem"}),
+        dbc.Row([
+            dbc.Col([
+                dbc.Label("Προθεσμία"),
+                dcc.Dropdown(
+                    id="plan-step",
+                    options=[
+                        {"label":"1. Επίδοση αγωγής","value":1},
+                        {"label":"2. Κατάθεση Προτάσεων / Υπομνήματος","value":2},
+                        {"label":"3. Κατάθεση Προσθήκης-Αντίκρουσης","value":3},
+                        {"label":"4. Άσκηση Παρέμβασης, Ανταγωγής κτλ","value":4},
+                    ],
+                    value=2, clearable=False
+                ),
+            ], md=4),
+            dbc.Col([
+                dbc.Label("Να λήγει όχι πριν από"),
+                dcc.DatePickerSingle(id="plan-deadline-from", display_format="DD/MM/YYYY"),
+            ], md=3),
+            dbc.Col([
+                dbc.Label("Να λήγει έως"),
+                dcc.DatePickerSingle(
+                    id="plan-deadline-to",
+                    display_format="DD/MM/YYYY",
+                    date=day_format(next_august_eve(date.today())).iso,
+                ),
+            ], md=3),
+            dbc.Col(dbc.Button("Εύρεση", id="btn-plan", color="primary", className="w-100 mt-4"), md=2),
+        ], className="g-3"),
+        html.Div(id="plan-result", className="text-info mt-3", style={"fontSize":"0.98rem"}),
+    ]),
+    className="card-clean"
+)
+
+DOCKET_PAGE_SIZE = 25
+
+docket_card = dbc.Card(
+    dbc.CardBody([
+        html.Div("🗂️ Docket αποθηκευμένων υποθέσεων", className="h5 mb-3"),
+        dbc.Input(id="in-case-search", type="search", debounce=True, className="mb-2",
+                  placeholder="Αναζήτηση πελάτη/αντιδίκου (π.χ. παπαδοπ, Papadopoulos)"),
+        html.Div(id="case-search-result", className="mb-3", style={"fontSize":"0.95rem"}),
+        # Σελιδοποίηση, ταξινόμηση & φίλτρα γίνονται στον server (SQLite)· ο browser κρατά μόνο την τρέχουσα σελίδα
+        dash_table.DataTable(
+            id="docket-table",
+            columns=[
+                {"name":"Πελάτης","id":"client"},
+                {"name":"Αντίδικος","id":"opponent"},
+                {"name":"Διαδικασία","id":"procedure"},
+                {"name":"Κατάθεση","id":"filing_date"},
+                {"name":"#","id":"step","type":"numeric"},
+                {"name":"Ενέργεια","id":"action"},
+                {"name":"Νομική βάση","id":"legal_basis"},
+                {"name":"Προθεσμία","id":"deadline"},
+                {"name":"Ημέρα","id":"weekday"},
+            ],
+            page_current=0,
+            page_size=DOCKET_PAGE_SIZE,
+            page_action="custom",
+            sort_action="custom",
+            sort_mode="multi",
+            sort_by=[],
+            filter_action="custom",
+            filter_query="",
+            filter_options={"case":"insensitive"},
+            style_table={"overflowX":"auto"},
+            style_cell={"fontSize":"0.9rem","textAlign":"left","whiteSpace":"nowrap"},
+        ),
+    ]),
+    className="card-clean"
+)
+
 app.layout = dbc.Container([
     html.Br(),
     html.H2("⚖️ Υπολογισμός Προθεσμιών ΚΠολΔ — Τακτική & Μικροδιαφορές",
             className="app-title"),
-    html.Div("(Με το νομοθετικό πλαίσιο μέχρι 31-12-2025)", className="app-subtitle"),
+    html.Div(f"(Με το νομοθετικό πλαίσιο μέχρι {day_format(RULE_SETS.verified_until).dmy})" if RULE_SETS.verified_until
+             else "(Με το ισχύον νομοθετικό πλαίσιο)", className="app-subtitle"),
     dbc.Row([
         dbc.Col(controls_card, md=5),
         dbc.Col(results_card, md=7),
     ], className="g-4"),
+    html.Br(),
+    dbc.Row([
+        dbc.Col(planner_card, md=12),
+    ], className="g-4"),
+    html.Br(),
+    dbc.Row([
+        dbc.Col(docket_card, md=12),
+    ], className="g-4"),
     html.Br()
 ], fluid=True)
 
@@ -266,11 +413,11 @@ def compute_deadlines(n_clicks, abroad_val, public_val, procedure_val, filing_da
     if not filing_date_str:
         return no_update, no_update, "Βάλε ημερομηνία κατάθεσης.", no_update
 
-    filing = parse_date_str(filing_date_str)
+    filing = parse_iso_date(filing_date_str)
     adjusted_note = ""
     if filing.weekday() >= 5:
         adj = next_monday(filing)
-        adjusted_note = f"Επιλέχθηκε Σ/Κ· η ημερομηνία κατάθεσης μεταφέρθηκε αυτόματα στη Δευτέρα {adj.strftime('%d-%m-%Y')}."
+        adjusted_note = f"Επιλέχθηκε Σ/Κ· η ημερομηνία κατάθεσης μεταφέρθηκε αυτόματα στη Δευτέρα {day_format(adj).dmy}."
         filing = adj
 
     abroad = (abroad_val == "yes")
@@ -282,11 +429,11 @@ def compute_deadlines(n_clicks, abroad_val, public_val, procedure_val, filing_da
         public_entity_party=public,
         procedure=procedure_val
     )
-    calc = DeadlineCalculator(ctx)
-    all_rows = calc.compute()
+    all_rows = list(compute_cached(ctx))
+    specs = rule_set_for(filing).steps(procedure_val)  # ημέρες του καθεστώτος που ισχύει στην κατάθεση
 
     # Αφαιρούμε τις 2 τελευταίες, όπως είχες ζητήσει παλαιότερα
-    rows = all_rows[:-2] if len(all_rows) >= 2 else all_rows
+    rows = shown_deadlines(all_rows)
 
     def rename_action(a: str) -> str:
         low = a.lower()
@@ -297,32 +444,27 @@ def compute_deadlines(n_clicks, abroad_val, public_val, procedure_val, filing_da
 
     def explain_calc(it, rows_all):
         lb = it.legal_basis
-        end_str = it.deadline.strftime("%d-%m-%Y")
-        wd = weekday_gr(it.deadline)
+        final = day_format(it.deadline).label
+        n = specs[it.step - 1].days_for(ctx)
         if "215" in lb:
-            n = 60 if abroad else 30
             extra = ", και 1/7–15/9" if public else ""
-            return f"Από την κατάθεση ({filing:%d-%m-%Y}) + {n} ημέρες, εξαιρώντας Αύγουστο{extra}. Μεταφορά αν Σ/Κ. Τελική: {wd} {end_str}."
+            return f"Από την κατάθεση ({day_format(filing).dmy}) + {n} ημέρες, εξαιρώντας Αύγουστο{extra}. Μεταφορά αν Σ/Κ. Τελική: {final}."
         if lb.startswith("ΚΠολΔ 237") and "§2" not in lb:
-            n = 120 if abroad else 90
             service = rows_all[0].deadline
-            return f"Από τη λήξη επίδοσης ({service:%d-%m-%Y}) + {n} ημέρες (λήξη 12:00). Τελική: {wd} {end_str}."
+            return f"Από τη λήξη επίδοσης ({day_format(service).dmy}) + {n} ημέρες (λήξη 12:00). Τελική: {final}."
         if "237 §2" in lb:
-            return f"+15 ημέρες από την προθεσμία προτάσεων ({rows_all[1].deadline:%d-%m-%Y}) (λήξη 12:00). Τελική: {wd} {end_str}."
+            return f"+{n} ημέρες από την προθεσμία προτάσεων ({day_format(rows_all[1].deadline).dmy}) (λήξη 12:00). Τελική: {final}."
         if "238 §1" in lb and "τελ" not in lb:
-            n = 90 if abroad else 60
-            return f"Παρεμπίπτουσες: από κατάθεση ({filing:%d-%m-%Y}) + {n} ημέρες. Τελική: {wd} {end_str}."
+            return f"Παρεμπίπτουσες: από κατάθεση ({day_format(filing).dmy}) + {n} ημέρες. Τελική: {final}."
         if "468 §1" in lb:
-            n = 30 if abroad else 10
-            return f"Μικροδιαφορές: από κατάθεση ({filing:%d-%m-%Y}) + {n} ημέρες. Τελική: {wd} {end_str}."
+            return f"Μικροδιαφορές: από κατάθεση ({day_format(filing).dmy}) + {n} ημέρες. Τελική: {final}."
         if "468 §2" in lb and "Υπόμνημα" in it.action:
-            return f"Μικροδιαφορές: 20 ημέρες από λήξη επίδοσης ({rows_all[0].deadline:%d-%m-%Y}). Τελική: {wd} {end_str}."
+            return f"Μικροδιαφορές: {n} ημέρες από λήξη επίδοσης ({day_format(rows_all[0].deadline).dmy}). Τελική: {final}."
         if "468 §2" in lb and "Προσθήκη" in it.action:
-            return f"Μικροδιαφορές: +5 ημέρες από το 20ήμερο ({rows_all[1].deadline:%d-%m-%Y}). Τελική: {wd} {end_str}."
+            return f"Μικροδιαφορές: +{n} ημέρες από το {specs[1].days_for(ctx)}ήμερο ({day_format(rows_all[1].deadline).dmy}). Τελική: {final}."
         if "468 §3" in lb and "κατάθεση" in it.action:
-            n = 40 if abroad else 20
-            return f"Μικροδιαφορές — παρεμπίπτουσες: από κατάθεση ({filing:%d-%m-%Y}) + {n} ημέρες. Τελική: {wd} {end_str}."
-        return f"Υπολογισμός βάσει {lb}. Τελική: {wd} {end_str}."
+            return f"Μικροδιαφορές — παρεμπίπτουσες: από κατάθεση ({day_format(filing).dmy}) + {n} ημέρες. Τελική: {final}."
+        return f"Υπολογισμός βάσει {lb}. Τελική: {final}."
 
     def law_text(it):
         lb = it.legal_basis
@@ -350,17 +492,22 @@ def compute_deadlines(n_clicks, abroad_val, public_val, procedure_val, filing_da
             "idx": idx,
             "action": rename_action(it.action),
             "legal_basis": it.legal_basis,
-            "deadline_iso": it.deadline.isoformat(),
-            "deadline_str": f"{weekday_gr(it.deadline)} {it.deadline.strftime('%d-%m-%Y')}",
+            "deadline_iso": day_format(it.deadline).iso,
+            "deadline_str": day_format(it.deadline).label,
             "calc_text": explain_calc(it, all_rows),
             "law_text": law_text(it),
         })
 
-    banner = f"Υπολογισμός ολοκληρώθηκε για Ημερ. κατάθεσης {filing.strftime('%d-%m-%Y')}" if rows_out else "Δεν προέκυψαν προθεσμίες."
-    filing_note = adjusted_note if adjusted_note else ""
+    banner = f"Υπολογισμός ολοκληρώθηκε για Ημερ. κατάθεσης {day_format(filing).dmy}" if rows_out else "Δεν προέκυψαν προθεσμίες."
+    notes = [adjusted_note] if adjusted_note else []
+    rules = rule_set_for(filing)
+    if not rules.is_verified_for(filing):
+        notes.append(f"Προσοχή: οι κανόνες έχουν ελεγχθεί για καταθέσεις έως {day_format(rules.verified_until).dmy}· "
+                     "επιβεβαίωσε τις προθεσμίες με τη νεότερη νομοθεσία.")
+    filing_note = " ".join(notes)
 
     meta = {
-        "filing": filing.strftime("%d-%m-%Y"),
+        "filing": day_format(filing).dmy,
         "procedure": "Τακτική" if procedure_val=="regular" else "Μικροδιαφορές",
         "abroad": "Ναι" if abroad else "Όχι",
         "public": "Ναι" if public else "Όχι",
@@ -442,10 +589,12 @@ def build_pdf_bytes(title: str, meta: dict, rows_list: list) -> bytes:
 
     buf = io.BytesIO()
 
-    font_name = "DejaVuSans"
+    font_name = "Helvetica"
     try:
-        if os.path.exists(GREEK_FONT_PATH) and "DejaVuSans" not in pdfmetrics.getRegisteredFontNames():
-            pdfmetrics.registerFont(TTFont("DejaVuSans", GREEK_FONT_PATH))
+        if os.path.exists(GREEK_FONT_PATH):
+            if "DejaVuSans" not in pdfmetrics.getRegisteredFontNames():
+                pdfmetrics.registerFont(TTFont("DejaVuSans", GREEK_FONT_PATH))
+            font_name = "DejaVuSans"
     except Exception:
         font_name = "Helvetica"
 
@@ -544,6 +693,127 @@ def export_pdf(n_clicks, rows, meta, client, opponent):
     return dcc.send_bytes(lambda b: b.write(data), filename=filename), msg
 
 
+# --------- Αποθήκευση υπόθεσης (SQLite) ----------
+@callback(
+    Output("save-case-message","children"),
+    Input("btn-save-case","n_clicks"),
+    State("in-abroad","value"),
+    State("in-public","value"),
+    State("in-procedure","value"),
+    State("in-filing-date","date"),
+    State("in-client","value"),
+    State("in-opponent","value"),
+    prevent_initial_call=True
+)
+def save_case(n_clicks, abroad_val, public_val, procedure_val, filing_date_str, client, opponent):
+    if not filing_date_str:
+        return "Βάλε ημερομηνία κατάθεσης."
+    client = (client or "").strip()
+    opponent = (opponent or "").strip()
+    if not client and not opponent:
+        return "Συμπλήρωσε Πελάτη ή Αντίδικο για να αποθηκευτεί η υπόθεση."
+
+    ctx = RuleContext(
+        filing_date=next_monday(parse_iso_date(filing_date_str)),
+        defendant_abroad_or_unknown=(abroad_val == "yes"),
+        public_entity_party=(public_val == "yes"),
+        procedure=procedure_val
+    )
+    key = make_case_key(client, opponent, ctx)
+    case_store.upsert_cases([CaseRecord(key, ctx, client, opponent, shown_deadlines(list(compute_cached(ctx))))])
+    return f"Η υπόθεση αποθηκεύτηκε ({client or '-'} vs {opponent or '-'}, κατάθεση {day_format(ctx.filing_date).dmy})."
+
+
+# --------- Σχεδιασμός κατάθεσης ----------
+@callback(
+    Output("plan-result","children"),
+    Input("btn-plan","n_clicks"),
+    State("plan-step","value"),
+    State("plan-deadline-from","date"),
+    State("plan-deadline-to","date"),
+    State("in-abroad","value"),
+    State("in-public","value"),
+    State("in-procedure","value"),
+    prevent_initial_call=True
+)
+def plan_filing(n_clicks, step, deadline_from_str, deadline_to_str, abroad_val, public_val, procedure_val):
+    if not deadline_from_str and not deadline_to_str:
+        return "Βάλε τουλάχιστον ένα όριο για την προθεσμία."
+    deadline_from = parse_iso_date(deadline_from_str) if deadline_from_str else None
+    deadline_to = parse_iso_date(deadline_to_str) if deadline_to_str else None
+    abroad, public = (abroad_val == "yes"), (public_val == "yes")
+
+    # Η κατάθεση προηγείται πάντα της προθεσμίας· αναζήτηση από σήμερα έως το άνω όριο.
+    # Χωρίς άνω όριο αρκεί η πρώτη κατάλληλη ημέρα (κάθε μεταγενέστερη κατάθεση ικανοποιεί το κάτω όριο).
+    search_from = date.today()
+    search_to = deadline_to or (max(search_from, deadline_from) + timedelta(days=730))
+    win = filing_window(step, abroad, public, procedure_val, search_from, search_to, deadline_from, deadline_to)
+    if win is None:
+        return "Καμία ημερομηνία κατάθεσης από σήμερα δεν ικανοποιεί τα όρια."
+    first, last = win
+    d_first = step_deadline(first, step, abroad, public, procedure_val)
+    if deadline_to is None:
+        return (f"Κατάθεση από {day_format(first).label} και μετά "
+                f"→ προθεσμία από {day_format(d_first).label} και μετά.")
+    d_last = step_deadline(last, step, abroad, public, procedure_val)
+    return (f"Κατάθεση από {day_format(first).label} έως {day_format(last).label} "
+            f"→ προθεσμία από {day_format(d_first).label} έως {day_format(d_last).label}.")
+
+
+# --------- Docket (server-side paging) ----------
+@callback(
+    Output("docket-table","data"),
+    Output("docket-table","page_count"),
+    Input("docket-table","page_current"),
+    Input("docket-table","page_size"),
+    Input("docket-table","sort_by"),
+    Input("docket-table","filter_query"),
+    Input("save-case-message","children"),
+)
+def update_docket(page_current, page_size, sort_by, filter_query, _saved):
+    page_size = page_size or DOCKET_PAGE_SIZE
+    page_current = page_current or 0
+    sort = [(s["column_id"], s["direction"] == "asc") for s in (sort_by or [])]
+    rows, total = case_store.docket_page(page_current * page_size, page_size, sort, split_filter_query(filter_query))
+    for r in rows:
+        for col in DOCKET_DATE_COLUMNS:
+            r[col] = day_format(parse_iso_date(r[col])).dmy
+    return rows, max(1, -(-total // page_size))
+
+
+# --------- Αναζήτηση υποθέσεων ----------
+def _search_label(doc: dict) -> str:
+    return f"{doc['client'] or '-'} vs {doc['opponent'] or '-'} — {doc['procedure']}, κατάθεση {doc['filing_date']}"
+
+@callback(
+    Output("case-search-result","children"),
+    Input("in-case-search","value"),
+    prevent_initial_call=True
+)
+def search_cases(query):
+    if not (query or "").strip():
+        return ""
+    hits = case_index.search(query, limit=20)
+    if not hits:
+        return html.Div("Καμία υπόθεση.", className="text-muted")
+    return html.Ul([html.Li(_search_label(d)) for d in hits], className="mb-0")
+
+@server.route(f"{BASE_PATH}api/cases/search")
+def api_search_cases():
+    from flask import jsonify, request
+    try:
+        limit = min(max(int(request.args.get("limit", 20)), 1), 200)
+    except ValueError:
+        limit = 20
+    hits = case_index.search(request.args.get("q", ""), limit=limit)
+    return jsonify({"query": request.args.get("q", ""), "count": len(hits), "results": hits})
+
+
+# Προσυμπιεσμένα static (αν έχει τρέξει `python asset_pipeline.py`)
+from asset_pipeline import install_precompressed
+install_precompressed(app)
+
+
 # ==========================
 #  Main (τοπική εκτέλεση)
 # ==========================
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+"""
+Προσυμπιεσμένα static αρχεία (gzip/brotli) για το Dash app.
+
+Build (μία φορά ανά deploy, μετά από αλλαγή assets/ ή αναβάθμιση dash):
+
+    python asset_pipeline.py
+
+Συμπιέζει assets/*.css|js και τα JS bundles των Dash components στο build/precompressed/,
+γράφει manifest με content hash (fingerprint/ETag) και τυπώνει την εξοικονόμηση bytes
+στο πρώτο φόρτωμα. Στο runtime, το install_precompressed(app) σερβίρει την καλύτερη
+διαθέσιμη κωδικοποίηση ανάλογα με το Accept-Encoding, με `Cache-Control: immutable`
+για τα URLs που φέρουν έκδοση (Dash fingerprint ή ?m=). Χωρίς build δεν αλλάζει τίποτα.
+
+Το θέμα FLATLY φορτώνεται από CDN (jsDelivr), που ήδη το σερβίρει συμπιεσμένο & cached.
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import sys
+
+try:
+    import brotli  # προαιρετικό
+except ImportError:
+    brotli = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PRECOMPRESSED_DIR = os.path.join(HERE, "build", "precompressed")
+MANIFEST_PATH = os.path.join(PRECOMPRESSED_DIR, "manifest.json")
+COMPRESSIBLE = (".css", ".js", ".map", ".json", ".svg", ".txt")
+SUITES = "_dash-component-suites/"
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# ==========================
+#  Build
+# ==========================
+def _sources(dash_app):
+    """(url key, αρχείο) για τα assets και όλα τα καταχωρημένα αρχεία των Dash components."""
+    assets_dir = dash_app.config.assets_folder
+    for root, _dirs, files in os.walk(assets_dir):
+        for name in files:
+            if name.endswith(COMPRESSIBLE):
+                full = os.path.join(root, name)
+                rel = os.path.relpath(full, assets_dir).replace(os.sep, "/")
+                yield "assets/" + rel, full
+    for package, rels in sorted(dash_app.registered_paths.items()):
+        pkg_dir = os.path.dirname(sys.modules[package].__file__)
+        for rel in sorted(rels):
+            full = os.path.join(pkg_dir, *rel.split("/"))
+            if rel.endswith(COMPRESSIBLE) and os.path.isfile(full):
+                yield f"{SUITES}{package}/{rel}", full
+
+def _first_load_keys(index_html: str, prefix: str):
+    """Manifest keys των <script>/<link> της αρχικής σελίδας."""
+    from dash.fingerprint import check_fingerprint
+    keys = set()
+    for url in re.findall(r'(?:src|href)="([^"]+)"', index_html):
+        path = url.split("?", 1)[0]
+        if not path.startswith(prefix):
+            continue
+        rest = path[len(prefix):]
+        if rest.startswith(SUITES):
+            package, _, fingerprinted = rest[len(SUITES):].partition("/")
+            keys.add(f"{SUITES}{package}/{check_fingerprint(fingerprinted)[0]}")
+        else:
+            keys.add(rest)
+    return keys
+
+def build(dash_app, out_dir=PRECOMPRESSED_DIR):
+    # Το index γεμίζει και τα registered_paths του Dash
+    index_html = dash_app.server.test_client().get(dash_app.config.routes_pathname_prefix).get_data(as_text=True)
+    first_load = _first_load_keys(index_html, dash_app.config.requests_pathname_prefix)
+    manifest = {}
+    for key, src in _sources(dash_app):
+        with open(src, "rb") as f:
+            raw = f.read()
+        st = os.stat(src)
+        entry = {"src": src, "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                 "etag": hashlib.sha256(raw).hexdigest()[:16], "raw": len(raw), "first_load": key in first_load}
+        variants = {"gzip": (".gz", gzip.compress(raw, 9, mtime=0))}
+        if brotli is not None:
+            variants["br"] = (".br", brotli.compress(raw, quality=11))
+        for enc, (ext, data) in variants.items():
+            if len(data) >= len(raw):
+                continue
+            dst = os.path.join(out_dir, *key.split("/")) + ext
+            os.makedirs(os.path.dirname(dst), exist_ok=True)
+            with open(dst, "wb") as f:
+                f.write(data)
+            entry[enc] = {"path": dst, "size": len(data)}
+        manifest[key] = entry
+    os.makedirs(out_dir, exist_ok=True)
+    with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    return manifest
+
+def savings_report(manifest) -> str:
+    lines = []
+    groups = [("Πρώτο φόρτωμα", [e for e in manifest.values() if e.get("first_load")]),
+              ("Όλα τα αρχεία", list(manifest.values()))]
+    for title, entries in groups:
+        raw = sum(e["raw"] for e in entries)
+        lines.append(f"{title}: {len(entries)} αρχεία, {raw/1024:.0f} KiB χωρίς συμπίεση")
+        for enc in ("gzip", "br"):
+            if raw and any(enc in e for e in entries):
+                size = sum(e.get(enc, {}).get("size", e["raw"]) for e in entries)
+                lines.append(f"  {enc:<5} {size/1024:8.0f} KiB  (−{(raw - size)/1024:.0f} KiB, {100*(raw - size)/raw:.0f}%)")
+    if brotli is None:
+        lines.append("  (brotli μη διαθέσιμο: pip install brotli)")
+    return "\n".join(lines)
+
+# ==========================
+#  Runtime
+# ==========================
+def _accepted(header: str):
+    accepted = set()
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+def load_manifest(path=MANIFEST_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    fresh = {}
+    for key, e in manifest.items():
+        try:
+            st = os.stat(e["src"])
+        except OSError:
+            continue
+        # Αγνοούμε ό,τι άλλαξε μετά το build (π.χ. νέο inline.css από ensure_assets_css)
+        if st.st_size == e["size"] and st.st_mtime_ns == e["mtime_ns"]:
+            fresh[key] = e
+    return fresh
+
+def install_precompressed(dash_app, manifest_path=MANIFEST_PATH):
+    """Σερβίρει προσυμπιεσμένα αρχεία και βάζει long-lived Cache-Control. Επιστρέφει πλήθος αρχείων."""
+    from flask import request, send_file
+    from dash.fingerprint import check_fingerprint
+
+    manifest = load_manifest(manifest_path)
+    prefix = dash_app.config.routes_pathname_prefix
+    server = dash_app.server
+
+    def _resolve(path):
+        """URL → (manifest key, έχει έκδοση στο URL) ή None."""
+        if not path.startswith(prefix):
+            return None
+        rest = path[len(prefix):]
+        if rest.startswith(SUITES):
+            package, _, fingerprinted = rest[len(SUITES):].partition("/")
+            rel, has_fp = check_fingerprint(fingerprinted)
+            return f"{SUITES}{package}/{rel}", has_fp
+        if rest.startswith("assets/"):
+            return rest, "m" in request.args
+        return None
+
+    @server.before_request
+    def _serve_precompressed():
+        if request.method != "GET":
+            return None
+        resolved = _resolve(request.path)
+        if not resolved or resolved[0] not in manifest:
+            return None
+        key, versioned = resolved
+        entry = manifest[key]
+        accepted = _accepted(request.headers.get("Accept-Encoding", ""))
+        enc = next((e for e in ("br", "gzip") if e in accepted and e in entry), None)
+        if enc is None:
+            return None
+        etag = f'{entry["etag"]}-{enc}'
+        mimetype = mimetypes.guess_type(key)[0] or "application/octet-stream"
+        resp = send_file(entry[enc]["path"], mimetype=mimetype, etag=etag, conditional=True, max_age=0)
+        resp.headers["Content-Encoding"] = enc
+        resp.headers["Vary"] = "Accept-Encoding"
+        resp.headers["Cache-Control"] = IMMUTABLE if versioned else "no-cache"
+        return resp
+
+    @server.after_request
+    def _long_lived_cache(resp):
+        # Και για ό,τι σερβίρεται χωρίς συμπίεση: URLs με έκδοση δεν αλλάζουν ποτέ
+        if request.method == "GET" and resp.status_code == 200:
+            resolved = _resolve(request.path)
+            if resolved and resolved[1]:
+                resp.headers["Cache-Control"] = IMMUTABLE
+        return resp
+
+    return len(manifest)
+
+if __name__ == "__main__":
+    sys.path.insert(0, HERE)
+    from app import app as dash_app
+    print(savings_report(build(dash_app)))
@@ -0,0 +1,95 @@
+from __future__ import annotations
+from array import array
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from .calculators import DeadlineItem
+from .rules import RuleContext, rule_set_for
+from .scenarios import ScenarioEngine
+from .utils import day_format
+
+class DeadlineBatch:
+    """Columnar αποθήκευση αποτελεσμάτων πολλών υποθέσεων.
+
+    Ανά γραμμή κρατά μόνο ακέραιους σε `array`: δείκτη υπόθεσης, βήμα, id κανόνα και
+    ημέρα (date ordinal, int32). Τα κείμενα (ενέργεια, νομική βάση, σημείωση) αποθηκεύονται
+    μία φορά στον πίνακα `rules`· τα DeadlineItem δημιουργούνται μόνο όταν ζητηθούν.
+    """
+
+    def __init__(self) -> None:
+        self.case_ids: List[str] = []
+        self.case_idx = array("i")
+        self.step = array("b")
+        self.rule = array("h")
+        self.day = array("i")
+        self.rules: List[Tuple[str, str, str]] = []  # (action, legal_basis, note)
+        self._rule_ids: Dict[Tuple[str, str, str], int] = {}
+        self._case_start = array("i")  # πρώτη γραμμή κάθε υπόθεσης (+ φρουρός στο τέλος)
+        self._case_start.append(0)
+
+    def _rule_id(self, action: str, legal_basis: str, note: str) -> int:
+        key = (action, legal_basis, note)
+        rid = self._rule_ids.get(key)
+        if rid is None:
+            rid = self._rule_ids[key] = len(self.rules)
+            self.rules.append(key)
+        return rid
+
+    def _add_row(self, case: int, step: int, rid: int, day: int) -> None:
+        self.case_idx.append(case)
+        self.step.append(step)
+        self.rule.append(rid)
+        self.day.append(day)
+
+    def append(self, case_id: str, items: Iterable[DeadlineItem]) -> None:
+        case = len(self.case_ids)
+        self.case_ids.append(case_id)
+        for it in items:
+            self._add_row(case, it.step, self._rule_id(it.action, it.legal_basis, it.note or ""), it.deadline.toordinal())
+        self._case_start.append(len(self.day))
+
+    @classmethod
+    def compute(cls, cases: Iterable[Tuple[str, RuleContext]]) -> "DeadlineBatch":
+        """Υπολογίζει κατευθείαν σε columnar μορφή (χωρίς ενδιάμεσα DeadlineItem)."""
+        batch = cls()
+        engine = ScenarioEngine([])
+        for case_id, ctx in cases:
+            specs = rule_set_for(ctx.filing_date).steps(ctx.procedure)
+            dates = engine.baseline_for(ctx)
+            case = len(batch.case_ids)
+            batch.case_ids.append(case_id)
+            for s, (spec, d) in enumerate(zip(specs, dates), start=1):
+                batch._add_row(case, s, batch._rule_id(spec.action, spec.legal_basis, spec.note), d.toordinal())
+            batch._case_start.append(len(batch.day))
+        return batch
+
+    # -----------------------------
+    # Lazy materialization
+    # -----------------------------
+    def __len__(self) -> int:
+        return len(self.day)
+
+    def item(self, row: int) -> DeadlineItem:
+        f = day_format(self.day[row])
+        action, legal_basis, note = self.rules[self.rule[row]]
+        return DeadlineItem(self.step[row], action, legal_basis, f.day, f.weekday, note)
+
+    def items_of(self, case: int) -> List[DeadlineItem]:
+        return [self.item(r) for r in range(self._case_start[case], self._case_start[case + 1])]
+
+    def __iter__(self) -> Iterator[Tuple[str, DeadlineItem]]:
+        for r in range(len(self.day)):
+            yield self.case_ids[self.case_idx[r]], self.item(r)
+
+    def by_case(self) -> Iterator[Tuple[str, List[DeadlineItem]]]:
+        for case, case_id in enumerate(self.case_ids):
+            yield case_id, self.items_of(case)
+
+    def rows_between(self, start: date, end: date) -> List[int]:
+        lo, hi = start.toordinal(), end.toordinal()
+        return [r for r, d in enumerate(self.day) if lo <= d <= hi]
+
+    def nbytes(self) -> int:
+        """Μέγεθος των αριθμητικών στηλών (χωρίς τα κοινά κείμενα)."""
+        cols: Sequence[array] = (self.case_idx, self.step, self.rule, self.day, self._case_start)
+        return sum(c.itemsize * len(c) for c in cols)
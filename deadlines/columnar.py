@@ -0,0 +1,145 @@
+"""
+Columnar export υπολογισμένων προθεσμιών (Arrow IPC / Parquet) για pandas/BI.
+
+Στήλες: case_id (string), step (int8), action & legal_basis (dictionary-encoded),
+deadline (date32). Το Arrow αρχείο διαβάζεται με memory-map (zero-copy), με προαιρετικό
+φίλτρο εύρους ημερομηνιών· το Parquet με predicate pushdown.
+
+Απαιτεί pyarrow (φορτώνεται μόνο όταν χρειαστεί).
+"""
+from __future__ import annotations
+import os
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .batch import DeadlineBatch
+from .calculators import DeadlineItem
+from .store import CaseStore
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+def _pa():
+    try:
+        import pyarrow
+    except ImportError as e:  # pragma: no cover - εξαρτάται από το περιβάλλον
+        raise ImportError("Το columnar export απαιτεί pyarrow (pip install pyarrow).") from e
+    return pyarrow
+
+def to_arrow_table(batch: Iterable[Tuple[str, Sequence[DeadlineItem]]]):
+    """(case_id, items) → pyarrow.Table. Τα κείμενα κωδικοποιούνται ως λεξικό μία φορά."""
+    pa = _pa()
+    case_ids: List[str] = []
+    steps: List[int] = []
+    days: List[int] = []
+    action_idx: List[int] = []
+    basis_idx: List[int] = []
+    actions: Dict[str, int] = {}
+    bases: Dict[str, int] = {}
+    for case_id, items in batch:
+        for it in items:
+            case_ids.append(case_id)
+            steps.append(it.step)
+            days.append(it.deadline.toordinal() - _EPOCH_ORDINAL)
+            action_idx.append(actions.setdefault(it.action, len(actions)))
+            basis_idx.append(bases.setdefault(it.legal_basis, len(bases)))
+    return pa.table({
+        "case_id": pa.array(case_ids, pa.string()),
+        "step": pa.array(steps, pa.int8()),
+        "action": pa.DictionaryArray.from_arrays(pa.array(action_idx, pa.int16()), pa.array(list(actions), pa.string())),
+        "legal_basis": pa.DictionaryArray.from_arrays(pa.array(basis_idx, pa.int16()), pa.array(list(bases), pa.string())),
+        "deadline": pa.array(days, pa.int32()).cast(pa.date32()),
+    })
+
+def batch_to_arrow_table(batch: DeadlineBatch):
+    """DeadlineBatch → pyarrow.Table απευθείας από τις στήλες του (χωρίς DeadlineItem)."""
+    pa = _pa()
+    import pyarrow.compute as pc
+    rule_idx = pa.array(batch.rule, pa.int16())
+    # Οι κανόνες διαφέρουν και στη σημείωση· τα λεξικά κρατούν μόνο διακριτές τιμές, με τη σειρά
+    # πρώτης εμφάνισης στις γραμμές (όπως το to_arrow_table), και κάθε κανόνας αντιστοιχίζεται σε αυτές
+    actions: Dict[str, int] = {}
+    bases: Dict[str, int] = {}
+    action_of = [0] * len(batch.rules)
+    basis_of = [0] * len(batch.rules)
+    for r in pc.unique(rule_idx).to_pylist():
+        action, basis = batch.rules[r][:2]
+        action_of[r] = actions.setdefault(action, len(actions))
+        basis_of[r] = bases.setdefault(basis, len(bases))
+    return pa.table({
+        "case_id": pa.DictionaryArray.from_arrays(pa.array(batch.case_idx, pa.int32()),
+                                                  pa.array(batch.case_ids, pa.string())).cast(pa.string()),
+        "step": pa.array(batch.step, pa.int8()),
+        "action": pa.DictionaryArray.from_arrays(pc.take(pa.array(action_of, pa.int16()), rule_idx),
+                                                 pa.array(list(actions), pa.string())),
+        "legal_basis": pa.DictionaryArray.from_arrays(pc.take(pa.array(basis_of, pa.int16()), rule_idx),
+                                                      pa.array(list(bases), pa.string())),
+        "deadline": pc.subtract(pa.array(batch.day, pa.int32()), _EPOCH_ORDINAL).cast(pa.int32()).cast(pa.date32()),
+    })
+
+def write_arrow(path: str, table, batch_rows: int = 64 * 1024) -> None:
+    # Χωρίς συμπίεση, ώστε το αρχείο να γίνεται memory-map χωρίς αντιγραφή·
+    # σε batches ώστε οι φιλτραρισμένες αναγνώσεις να προχωρούν σταδιακά
+    pa = _pa()
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table, max_chunksize=batch_rows)
+
+def write_parquet(path: str, table, compression: str = "zstd") -> None:
+    import pyarrow.parquet as pq
+    pq.write_table(table, path, compression=compression)
+
+def export_batch(path: str, batch: Iterable[Tuple[str, Sequence[DeadlineItem]]]) -> int:
+    """Γράφει Arrow IPC (.arrow/.feather) ή Parquet (.parquet) ανάλογα με την κατάληξη."""
+    table = to_arrow_table(batch)
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".parquet":
+        write_parquet(path, table)
+    elif ext in (".arrow", ".feather", ".ipc"):
+        write_arrow(path, table)
+    else:
+        raise ValueError(f"Unsupported export format: {ext!r} (expected .arrow or .parquet)")
+    return table.num_rows
+
+def _date_filter(pc, column, start: Optional[date], end: Optional[date]):
+    mask = None
+    if start is not None:
+        mask = pc.greater_equal(column, start)
+    if end is not None:
+        upper = pc.less_equal(column, end)
+        mask = upper if mask is None else pc.and_(mask, upper)
+    return mask
+
+def read_arrow(path: str, start: Optional[date] = None, end: Optional[date] = None):
+    """Memory-mapped ανάγνωση· χωρίς φίλτρο ο πίνακας δείχνει απευθείας στο αρχείο (zero-copy),
+    με φίλτρο αντιγράφονται μόνο οι γραμμές που ταιριάζουν, batch προς batch."""
+    pa = _pa()
+    import pyarrow.compute as pc
+    reader = pa.ipc.open_file(pa.memory_map(path, "r"))
+    if start is None and end is None:
+        return reader.read_all()
+    batches = []
+    for i in range(reader.num_record_batches):
+        rb = reader.get_batch(i)
+        batches.append(rb.filter(_date_filter(pc, rb.column("deadline"), start, end)))
+    return pa.Table.from_batches(batches, schema=reader.schema)
+
+def read_parquet(path: str, start: Optional[date] = None, end: Optional[date] = None):
+    import pyarrow.parquet as pq
+    filters = []
+    if start is not None:
+        filters.append(("deadline", ">=", start))
+    if end is not None:
+        filters.append(("deadline", "<=", end))
+    return pq.read_table(path, filters=filters or None, memory_map=True)
+
+def export_store(path: str, store: CaseStore, start: date = date.min, end: date = date.max) -> int:
+    """Εξάγει τις αποθηκευμένες προθεσμίες (λήξη στο [start, end]) του CaseStore."""
+    by_case: Dict[str, List[DeadlineItem]] = {}
+    for case_key, it in store.deadlines_between(start, end):
+        by_case.setdefault(case_key, []).append(it)
+    return export_batch(path, by_case.items())
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) != 2:
+        raise SystemExit("usage: python -m deadlines.columnar OUT.(arrow|parquet)")
+    print(f"{export_store(sys.argv[1], CaseStore())} γραμμές → {sys.argv[1]}")
@@ -10,6 +10,7 @@ from reportlab.pdfbase.ttfonts import TTFont
 import os
 
 from .calculators import DeadlineItem
+from .utils import day_format
 
 GREEK_FONT_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "DejaVuSans.ttf")
 
@@ -61,7 +62,7 @@ def make_pdf(path: str, title: str, meta: dict, rows: List[DeadlineItem]) -> Non
 
         c.rect(x, y-10*mm, sum(col_widths), 10*mm, stroke=1, fill=0)
         cx = x + 2
-        vals = [str(it.step), it.action, it.legal_basis, it.deadline.strftime("%d-%m-%Y"), it.weekday, it.note or ""]
+        vals = [str(it.step), it.action, it.legal_basis, day_format(it.deadline).dmy, it.weekday, it.note or ""]
         for i, v in enumerate(vals):
             c.drawString(cx, y-7*mm, v[:60])
             cx += col_widths[i]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from datetime import date, timedelta
+from typing import Callable, Optional, Tuple
+
+from .calculators import DeadlineCalculator
+from .rules import RuleContext
+
+# Κάθε προθεσμία είναι μη φθίνουσα συνάρτηση της ημερομηνίας κατάθεσης (οι εξαιρέσεις
+# και η μεταφορά Σ/Κ μόνο «σπρώχνουν» προς τα εμπρός), οπότε αρκεί δυαδική αναζήτηση.
+# Προσοχή: ισχύει εντός ενός RuleSet· αν νέο καθεστώς μικραίνει προθεσμίες, ψάξε ανά περίοδο ισχύος.
+
+def step_deadline(filing: date, step: int, abroad: bool, public: bool, procedure: str) -> date:
+    items = DeadlineCalculator(RuleContext(filing, abroad, public, procedure)).compute()
+    for it in items:
+        if it.step == step:
+            return it.deadline
+    raise ValueError(f"Unknown step {step} for procedure {procedure!r}")
+
+def _first_true(lo: date, hi: date, pred: Callable[[date], bool]) -> Optional[date]:
+    """Πρώτη ημέρα στο [lo, hi] όπου ισχύει το (μονότονο false→true) pred."""
+    a, b = lo.toordinal(), hi.toordinal() + 1
+    while a < b:
+        mid = (a + b) // 2
+        if pred(date.fromordinal(mid)):
+            b = mid
+        else:
+            a = mid + 1
+    return date.fromordinal(a) if a <= hi.toordinal() else None
+
+def _business_on_or_after(d: date) -> date:
+    while d.weekday() >= 5:
+        d += timedelta(days=1)
+    return d
+
+def _business_on_or_before(d: date) -> date:
+    while d.weekday() >= 5:
+        d -= timedelta(days=1)
+    return d
+
+def filing_window(step: int, abroad: bool, public: bool, procedure: str,
+                  search_from: date, search_to: date,
+                  deadline_from: Optional[date] = None,
+                  deadline_to: Optional[date] = None) -> Optional[Tuple[date, date]]:
+    """Εργάσιμες ημερομηνίες κατάθεσης [πρώτη, τελευταία] στο [search_from, search_to]
+    για τις οποίες η προθεσμία του `step` πέφτει στο [deadline_from, deadline_to].
+    Επιστρέφει None αν δεν υπάρχει τέτοια ημερομηνία."""
+    f = lambda d: step_deadline(d, step, abroad, public, procedure)
+    first, last = _business_on_or_after(search_from), _business_on_or_before(search_to)
+    if first > last:
+        return None
+    if deadline_from is not None:
+        first = _first_true(first, last, lambda d: f(d) >= deadline_from)
+        if first is None:
+            return None
+        first = _business_on_or_after(first)
+    if deadline_to is not None:
+        after = _first_true(first, last, lambda d: f(d) > deadline_to)
+        if after is not None:
+            last = _business_on_or_before(after - timedelta(days=1))
+    return (first, last) if first <= last else None
+
+def latest_filing_before(step: int, abroad: bool, public: bool, procedure: str,
+                         deadline_to: date, search_from: date) -> Optional[date]:
+    """Τελευταία εργάσιμη κατάθεση (από `search_from`) με προθεσμία του `step` έως `deadline_to`."""
+    win = filing_window(step, abroad, public, procedure, search_from, deadline_to,
+                        deadline_to=deadline_to)
+    return win[1] if win else None
+
+def latest_filing_before_august(step: int, abroad: bool, public: bool, procedure: str,
+                                year: int, search_from: date) -> Optional[date]:
+    """Τελευταία κατάθεση ώστε η προθεσμία του `step` να λήγει πριν την αναστολή Αυγούστου του `year`."""
+    return latest_filing_before(step, abroad, public, procedure, date(year, 7, 31), search_from)
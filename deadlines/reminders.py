@@ -0,0 +1,351 @@
+"""
+Υπενθυμίσεις προθεσμιών N εργάσιμες ημέρες πριν από τη λήξη.
+
+Οι επόμενες υπενθυμίσεις κρατιούνται σε min-heap· ο scheduler κοιμάται μέχρι την πρώτη,
+παραδίδει μαζί όσες λήγουν την ίδια στιγμή και ενημερώνεται σταδιακά όταν αλλάζουν
+υποθέσεις στο CaseStore (χωρίς επανυπολογισμό ή σάρωση όλου του docket). Αλλαγές από
+άλλες διεργασίες (π.χ. workers του app) διαβάζονται από το ημερολόγιο αλλαγών του store.
+
+Τρέχει σε ΜΙΑ διεργασία ανά βάση (lock αρχείου δίπλα στη βάση): μέσα στο app
+(DEADLINES_REMINDER_*) αναλαμβάνει ένας μόνο worker, ή ως ξεχωριστή υπηρεσία:
+
+    python -m deadlines.reminders --maildir ~/Maildir/deadlines --lead-days 3
+"""
+from __future__ import annotations
+import argparse
+import heapq
+import io
+import json
+import logging
+import mailbox
+import os
+import smtplib
+import threading
+import urllib.request
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from email.message import EmailMessage
+from typing import IO, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .calculators import DeadlineItem
+from .store import CaseStore
+from .utils import day_format
+
+log = logging.getLogger(__name__)
+
+@dataclass(frozen=True)
+class Reminder:
+    due: datetime
+    case_key: str
+    step: int
+    action: str
+    legal_basis: str
+    deadline: date
+
+def working_days_before(d: date, n: int) -> date:
+    """Η ημέρα n εργάσιμες (Δευ–Παρ) πριν από το d."""
+    while n > 0:
+        d -= timedelta(days=1)
+        if d.weekday() < 5:
+            n -= 1
+    return d
+
+# -----------------------------
+# Sinks
+# -----------------------------
+class ReminderSink(ABC):
+    @abstractmethod
+    def deliver(self, batch: Sequence[Reminder]) -> None:
+        ...
+
+def _format_batch(batch: Sequence[Reminder]) -> Tuple[str, str]:
+    subject = f"Υπενθύμιση: {len(batch)} προθεσμίες" if len(batch) > 1 else f"Υπενθύμιση: {batch[0].action}"
+    body = "\n".join(f"{day_format(r.deadline).dmy}  {r.action} ({r.legal_basis}) — {r.case_key}" for r in batch)
+    return subject, body
+
+def _as_email(batch: Sequence[Reminder], sender: str, to: str) -> EmailMessage:
+    subject, body = _format_batch(batch)
+    msg = EmailMessage()
+    msg["Subject"], msg["From"], msg["To"] = subject, sender, to
+    msg.set_content(body)
+    return msg
+
+class MaildirSink(ReminderSink):
+    """Τοπικό Maildir — αντικαθιστά το SMTP σε δοκιμές/τοπική χρήση."""
+    def __init__(self, path: str, sender: str = "deadlines@localhost", to: str = "office@localhost"):
+        for sub in ("tmp", "new", "cur"):  # το Maildir(create=True) δεν τα φτιάχνει σε υπάρχοντα φάκελο
+            os.makedirs(os.path.join(path, sub), exist_ok=True)
+        self.box = mailbox.Maildir(path, create=True)
+        self.sender, self.to = sender, to
+
+    def deliver(self, batch: Sequence[Reminder]) -> None:
+        self.box.add(_as_email(batch, self.sender, self.to))
+
+class SMTPSink(ReminderSink):
+    def __init__(self, host: str, sender: str, to: str, port: int = 25):
+        self.host, self.port, self.sender, self.to = host, port, sender, to
+
+    def deliver(self, batch: Sequence[Reminder]) -> None:
+        with smtplib.SMTP(self.host, self.port, timeout=30) as smtp:
+            smtp.send_message(_as_email(batch, self.sender, self.to))
+
+class WebhookSink(ReminderSink):
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url, self.timeout = url, timeout
+
+    def deliver(self, batch: Sequence[Reminder]) -> None:
+        payload = [{
+            "due": r.due.isoformat(), "case_key": r.case_key, "step": r.step,
+            "action": r.action, "legal_basis": r.legal_basis, "deadline": day_format(r.deadline).iso,
+        } for r in batch]
+        req = urllib.request.Request(self.url, data=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
+                                     headers={"Content-Type": "application/json"}, method="POST")
+        with urllib.request.urlopen(req, timeout=self.timeout):
+            pass
+
+# -----------------------------
+# Scheduler
+# -----------------------------
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 3600
+POLL_SECONDS = 30  # έλεγχος για αλλαγές από άλλες διεργασίες
+
+class ReminderScheduler:
+    """Min-heap από (due, seq, case_key, version, Reminder). Όταν αλλάζει μια υπόθεση
+    αυξάνεται η version της και μπαίνουν οι νέες υπενθυμίσεις· οι παλιές εγγραφές
+    απορρίπτονται όταν φτάσουν στην κορυφή (lazy deletion)."""
+
+    def __init__(self, store: CaseStore, sink: ReminderSink, lead_days: int = 3,
+                 remind_at: time = time(9, 0), clock: Callable[[], datetime] = datetime.now):
+        self.store, self.sink = store, sink
+        self.lead_days, self.remind_at, self.clock = lead_days, remind_at, clock
+        self._heap: List[Tuple[datetime, int, str, int, Reminder]] = []
+        self._versions: Dict[str, int] = {}
+        self._live_count: Dict[str, int] = {}
+        self._seq = 0
+        self._stale = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._failures = 0  # διαδοχικές αποτυχίες παράδοσης → εκθετικό backoff
+        self._seen_seq = 0  # τελευταία αλλαγή του store που έχει ληφθεί υπόψη
+        self.lock_file: Optional[IO] = None  # κρατά το lock του scheduler όσο ζει η διεργασία
+
+    def _reminder_for(self, case_key: str, it: DeadlineItem, now: datetime) -> Optional[Reminder]:
+        """Υπενθύμιση lead_days εργάσιμες πριν· αν αυτή η στιγμή έχει ήδη περάσει αλλά η
+        προθεσμία όχι (επείγουσα υπόθεση), προγραμματίζεται αμέσως. None αν έληξε."""
+        if it.deadline < now.date():
+            return None
+        due = max(now, datetime.combine(working_days_before(it.deadline, self.lead_days), self.remind_at))
+        return Reminder(due, case_key, it.step, it.action, it.legal_basis, it.deadline)
+
+    def _push(self, rem: Reminder) -> None:
+        self._seq += 1
+        self._live_count[rem.case_key] = self._live_count.get(rem.case_key, 0) + 1
+        heapq.heappush(self._heap, (rem.due, self._seq, rem.case_key, self._versions.get(rem.case_key, 0), rem))
+
+    def load(self) -> int:
+        """Αρχικό γέμισμα από το store: όλες οι προθεσμίες που δεν έχουν λήξει."""
+        now = self.clock()
+        seq = self.store.change_seq()  # πριν την ανάγνωση, ώστε να μη χαθεί ταυτόχρονη εγγραφή
+        with self._lock:
+            self._heap, self._versions, self._live_count, self._stale = [], {}, {}, 0
+            self._seen_seq = seq
+            sent = self.store.reminded()
+            for case_key, it in self.store.deadlines_between(now.date(), date.max):
+                rem = self._reminder_for(case_key, it, now)
+                if rem is not None and (case_key, it.step, it.deadline) not in sent:
+                    self._push(rem)
+            n = len(self._heap)
+        self._wake.set()
+        return n
+
+    def update_cases(self, case_keys: Iterable[str]) -> None:
+        """Σταδιακή ενημέρωση (π.χ. από CaseStore.subscribe) για υποθέσεις που άλλαξαν/διαγράφηκαν."""
+        now = self.clock()
+        case_keys = list(case_keys)
+        sent = self.store.reminded(case_keys)
+        with self._lock:
+            for key in case_keys:
+                self._versions[key] = self._versions.get(key, 0) + 1
+                self._stale += self._live_count.pop(key, 0)
+                rec = self.store.get_case(key)
+                for it in (rec.items if rec else []):
+                    rem = self._reminder_for(key, it, now)
+                    if rem is not None and (key, it.step, it.deadline) not in sent:
+                        self._push(rem)
+            self._compact_if_needed()
+        self._wake.set()
+
+    def poll_store(self) -> int:
+        """Εφαρμόζει αλλαγές που έγιναν από άλλες διεργασίες (π.χ. workers του app)."""
+        seq, keys = self.store.changes_since(self._seen_seq)
+        if keys is None:
+            self.load()
+            return -1
+        if keys:
+            self.update_cases(keys)
+        self._seen_seq = seq
+        return len(keys)
+
+    def _live(self, entry: Tuple[datetime, int, str, int, Reminder]) -> bool:
+        return entry[3] == self._versions.get(entry[2], 0)
+
+    def _pop(self) -> Tuple[datetime, int, str, int, Reminder]:
+        entry = heapq.heappop(self._heap)
+        if self._live(entry):
+            self._live_count[entry[2]] -= 1
+        else:
+            self._stale -= 1
+        return entry
+
+    def _compact_if_needed(self) -> None:
+        if self._stale and self._stale * 2 > len(self._heap):
+            self._heap = [e for e in self._heap if self._live(e)]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+    def next_due(self) -> Optional[datetime]:
+        with self._lock:
+            while self._heap and not self._live(self._heap[0]):
+                self._pop()
+            return self._heap[0][0] if self._heap else None
+
+    def _retry_delay(self) -> timedelta:
+        return timedelta(seconds=min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** (self._failures - 1)))
+
+    def _requeue(self, entries: List[Tuple[datetime, int, str, int, Reminder]], due: datetime) -> None:
+        """Ξαναβάζει αποτυχημένη παρτίδα στο heap (όσες εγγραφές δεν έχουν στο μεταξύ αντικατασταθεί)."""
+        with self._lock:
+            for _due, _seq, key, version, rem in entries:
+                if version != self._versions.get(key, 0):
+                    continue
+                self._seq += 1
+                self._live_count[key] = self._live_count.get(key, 0) + 1
+                heapq.heappush(self._heap, (due, self._seq, key, version, rem))
+
+    def run_pending(self, now: Optional[datetime] = None) -> int:
+        """Παραδίδει όσες υπενθυμίσεις έχουν λήξει· μία παρτίδα ανά κοινή ώρα λήξης.
+        Αν αποτύχει η παράδοση, η παρτίδα ξαναμπαίνει στο heap με backoff."""
+        now = now or self.clock()
+        batches: Dict[datetime, List[Tuple[datetime, int, str, int, Reminder]]] = {}
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                live = self._live(self._heap[0])
+                entry = self._pop()
+                if live:
+                    batches.setdefault(entry[0], []).append(entry)
+        delivered = 0
+        for due in sorted(batches):
+            entries = batches[due]
+            try:
+                self.sink.deliver([e[4] for e in entries])
+            except Exception:
+                self._failures += 1
+                retry = self._retry_delay()
+                log.exception("Αποτυχία παράδοσης %d υπενθυμίσεων· νέα προσπάθεια σε %s", len(entries), retry)
+                self._requeue(entries, now + retry)
+            else:
+                self._failures = 0
+                delivered += len(entries)
+                self.store.mark_reminded([(e[4].case_key, e[4].step, e[4].deadline) for e in entries])
+        return delivered
+
+    def run_forever(self, max_sleep: float = 3600.0, poll_interval: Optional[float] = None) -> None:
+        poll_interval = POLL_SECONDS if poll_interval is None else poll_interval
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                self.poll_store()
+                self.run_pending()
+                due = self.next_due()
+                timeout = poll_interval if due is None else (due - self.clock()).total_seconds()
+                timeout = max(0.0, min(max_sleep, poll_interval, timeout))
+            except Exception:  # το thread δεν πρέπει ποτέ να τερματίσει από σφάλμα
+                log.exception("Σφάλμα στον scheduler υπενθυμίσεων")
+                timeout = RETRY_BASE_SECONDS
+            # Ξυπνά νωρίτερα αν αλλάξει υπόθεση ή ζητηθεί τερματισμός
+            self._wake.wait(timeout)
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wake.set()
+
+def lock_path(store: CaseStore) -> Optional[str]:
+    return None if store.path == ":memory:" else store.path + ".reminders.lock"
+
+def try_exclusive_lock(path: Optional[str]) -> Optional[IO]:
+    """Μη blocking αποκλειστικό lock αρχείου· το κρατά ανοιχτό όποιος το πάρει, μέχρι να τερματίσει.
+    None αν το κρατά ήδη άλλη διεργασία. Για path=None (βάση στη μνήμη) δεν χρειάζεται lock."""
+    if path is None:
+        return io.StringIO()
+    f = open(path, "a+")
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+def start_in_background(store: CaseStore, sink: ReminderSink, lead_days: int = 3,
+                        retry_lock: float = 60.0) -> ReminderScheduler:
+    """Scheduler σε daemon thread — μόνο σε μία διεργασία ανά βάση (lock αρχείου). Οι
+    υπόλοιπες (π.χ. άλλοι workers του app) περιμένουν και αναλαμβάνουν αν εκείνη τερματίσει."""
+    sched = ReminderScheduler(store, sink, lead_days)
+
+    def _run() -> None:
+        while not sched._stop.is_set():
+            sched.lock_file = try_exclusive_lock(lock_path(store))
+            if sched.lock_file is not None:
+                break
+            sched._stop.wait(retry_lock)
+        else:
+            return
+        store.subscribe(sched.update_cases)
+        sched.load()
+        sched.run_forever()
+
+    threading.Thread(target=_run, name="deadline-reminders", daemon=True).start()
+    return sched
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--db", default=None, help="SQLite αρχείο (προεπιλογή: DEADLINES_DB_PATH)")
+    ap.add_argument("--lead-days", type=int, default=3)
+    target = ap.add_mutually_exclusive_group(required=True)
+    target.add_argument("--maildir")
+    target.add_argument("--webhook")
+    target.add_argument("--smtp", help="host[:port]")
+    ap.add_argument("--mail-from", default="deadlines@localhost")
+    ap.add_argument("--mail-to", default="office@localhost")
+    args = ap.parse_args(argv)
+
+    store = CaseStore(args.db) if args.db else CaseStore()
+    if args.maildir:
+        sink: ReminderSink = MaildirSink(args.maildir, args.mail_from, args.mail_to)
+    elif args.webhook:
+        sink = WebhookSink(args.webhook)
+    else:
+        host, _, port = args.smtp.partition(":")
+        sink = SMTPSink(host, args.mail_from, args.mail_to, int(port or 25))
+
+    sched = ReminderScheduler(store, sink, args.lead_days)
+    sched.lock_file = try_exclusive_lock(lock_path(store))
+    if sched.lock_file is None:
+        raise SystemExit("Ο scheduler υπενθυμίσεων τρέχει ήδη σε άλλη διεργασία γι' αυτή τη βάση.")
+    store.subscribe(sched.update_cases)
+    print(f"Φορτώθηκαν {sched.load()} υπενθυμίσεις.")
+    try:
+        sched.run_forever()
+    except KeyboardInterrupt:
+        sched.stop()
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,8 +1,9 @@
 
 from __future__ import annotations
-from dataclasses import dataclass
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from datetime import date
-from typing import List
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from .utils import Period
 
 @dataclass
@@ -26,3 +27,118 @@ def build_exclusion_periods(ctx: RuleContext) -> List[Period]:
         if ctx.public_entity_party:
             ex.extend(state_vacation_periods(y))
     return ex
+
+@dataclass(frozen=True)
+class StepSpec:
+    action: str
+    legal_basis: str
+    anchor: int       # 0 = κατάθεση, k = (μη μεταφερμένη) λήξη του βήματος k
+    days: int
+    days_abroad: int  # εναγόμενος εξωτερικού/αγνώστου
+    note: str = ""
+
+    def days_for(self, ctx: RuleContext) -> int:
+        return self.days_abroad if ctx.defendant_abroad_or_unknown else self.days
+
+REGULAR_STEPS: Tuple[StepSpec, ...] = (
+    # 1) Service (215 §2): 30/60 from filing
+    StepSpec("Επίδοση αγωγής", "ΚΠολΔ 215 §2", 0, 30, 60, "Μη εμπρόθεσμη επίδοση: αγωγή μη ασκηθείσα"),
+    # 2) Proposals (237): 90/120 from end of service period
+    StepSpec("Προτάσεις & αποδεικτικά", "ΚΠολΔ 237", 1, 90, 120, "Λήξη 12:00"),
+    # 3) Addition (237 §2): +15
+    StepSpec("Προσθήκη–αντίκρουση", "ΚΠολΔ 237 §2", 2, 15, 15, "Λήξη 12:00"),
+    # 4) Ancillary deposit & service (238 §1): 60/90 from filing
+    StepSpec("Παρεμπίπτουσες – κατάθεση & επίδοση", "ΚΠολΔ 238 §1", 0, 60, 90),
+    # 5) Ancillary proposals (238 §1 last): 120/180 from filing
+    StepSpec("Προτάσεις επί παρεμπιπτουσών", "ΚΠολΔ 238 §1 (τελ.)", 0, 120, 180, "Λήξη 12:00"),
+    # 6) Ancillary addition: +15
+    StepSpec("Προσθήκη–αντίκρουση επί παρεμπιπτουσών", "ΚΠολΔ 238 §1 → 237 §2", 5, 15, 15, "Λήξη 12:00"),
+)
+
+SMALL_CLAIMS_STEPS: Tuple[StepSpec, ...] = (
+    # 1) Service (468 §1): 10/30 from filing
+    StepSpec("Επίδοση αγωγής", "ΚΠολΔ 468 §1", 0, 10, 30),
+    # 2) Memo & evidence (468 §2): 20 from end of service period
+    StepSpec("Υπόμνημα εναγομένου & αποδεικτικά", "ΚΠολΔ 468 §2", 1, 20, 20),
+    # 3) Addition (468 §2): +5
+    StepSpec("Προσθήκη–αντίκρουση", "ΚΠολΔ 468 §2", 2, 5, 5),
+    # 4) Ancillary deposit & service (468 §3): 20/40 from filing
+    StepSpec("Παρεμπίπτουσες – κατάθεση & επίδοση", "ΚΠολΔ 468 §3", 0, 20, 40),
+    # 5) Ancillary memo & evidence (468 §3): 30/50 from filing
+    StepSpec("Αποδεικτικά & υπόμνημα επί παρεμπιπτουσών", "ΚΠολΔ 468 §3", 0, 30, 50),
+    # 6) Ancillary addition: +5
+    StepSpec("Προσθήκη–αντίκρουση επί παρεμπιπτουσών", "ΚΠολΔ 468 §3 → §2", 5, 5, 5),
+)
+
+# -----------------------------
+# Εκδόσεις κανόνων ανά ημερομηνία έναρξης ισχύος
+# -----------------------------
+@dataclass(frozen=True)
+class RuleSet:
+    """Ένα νομοθετικό καθεστώς: βήματα ανά διαδικασία + ημερολόγιο αναστολών.
+    Ισχύει από `effective_from` μέχρι την έναρξη του επόμενου στο RuleSetIndex.
+    `verified_until`: ως ποια ημερομηνία κατάθεσης έχει ελεγχθεί έναντι της νομοθεσίας
+    (None = χωρίς όριο)· αργότερες καταθέσεις υπολογίζονται, αλλά πρέπει να επισημαίνονται."""
+    name: str
+    effective_from: date
+    regular: Tuple[StepSpec, ...]
+    small_claims: Tuple[StepSpec, ...]
+    exclusion_builder: Callable[[RuleContext], List[Period]] = build_exclusion_periods
+    verified_until: Optional[date] = None
+    _exclusions: Dict[Tuple[int, bool], Tuple[Period, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        # Χρησιμοποιείται ως κλειδί cache· η ισότητα μένει σε όλα τα πεδία, το hash αποφεύγει τα βήματα
+        return hash((self.name, self.effective_from))
+
+    def is_verified_for(self, d: date) -> bool:
+        return self.verified_until is None or d <= self.verified_until
+
+    def steps(self, procedure: str) -> Tuple[StepSpec, ...]:
+        return self.regular if procedure == "regular" else self.small_claims
+
+    def exclusions(self, ctx: RuleContext) -> Tuple[Period, ...]:
+        # Οι εξαιρέσεις εξαρτώνται μόνο από έτος κατάθεσης & Δημόσιο → χτίζονται μία φορά
+        key = (ctx.filing_date.year, ctx.public_entity_party)
+        ex = self._exclusions.get(key)
+        if ex is None:
+            ex = self._exclusions[key] = tuple(self.exclusion_builder(ctx))
+        return ex
+
+class RuleSetIndex:
+    def __init__(self, rule_sets: Sequence[RuleSet]):
+        self.rule_sets: List[RuleSet] = sorted(rule_sets, key=lambda r: r.effective_from)
+        self._starts: List[date] = [r.effective_from for r in self.rule_sets]
+        if len(set(self._starts)) != len(self._starts):
+            raise ValueError("Rule sets must have distinct effective_from dates")
+
+    def for_date(self, d: date) -> RuleSet:
+        i = bisect_right(self._starts, d) - 1
+        if i < 0:
+            raise ValueError(f"No rule set in force on {d.isoformat()}")
+        return self.rule_sets[i]
+
+    def effective_to(self, rule_set: RuleSet) -> Optional[date]:
+        """Τελευταία ημέρα ισχύος (None = ισχύει ακόμη)."""
+        i = self.rule_sets.index(rule_set)
+        if i + 1 == len(self.rule_sets):
+            return None
+        return date.fromordinal(self._starts[i + 1].toordinal() - 1)
+
+    @property
+    def verified_until(self) -> Optional[date]:
+        """Όριο ελέγχου του τελευταίου (ισχύοντος) καθεστώτος."""
+        return self.rule_sets[-1].verified_until
+
+# Το ισχύον πλαίσιο εφαρμόζεται και σε παλαιότερες καταθέσεις (όπως μέχρι σήμερα)·
+# νέο καθεστώς = νέο RuleSet με effective_from την ημερομηνία έναρξης ισχύος του.
+# Έχει ελεγχθεί για καταθέσεις έως 31-12-2025: μετά από έλεγχο νεότερης νομοθεσίας,
+# μετακίνησε το verified_until (ή πρόσθεσε νέο RuleSet).
+KPOLD_CURRENT = RuleSet("ΚΠολΔ — ισχύον πλαίσιο", date.min, REGULAR_STEPS, SMALL_CLAIMS_STEPS,
+                        verified_until=date(2025, 12, 31))
+
+RULE_SETS = RuleSetIndex([KPOLD_CURRENT])
+
+def rule_set_for(filing_date: date) -> RuleSet:
+    return RULE_SETS.for_date(filing_date)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .rules import RuleContext, RuleSet, august_suspension_periods, state_vacation_periods, rule_set_for
+from .utils import Period
+
+ExclusionBuilder = Callable[[RuleContext], List[Period]]
+
+@dataclass(frozen=True)
+class Scenario:
+    """Εναλλακτικό ημερολόγιο αναστολών. Το `exclusions` έχει την υπογραφή του
+    build_exclusion_periods και πρέπει να εξαρτάται μόνο από το έτος κατάθεσης και
+    το public_entity_party (με αυτά κλειδώνεται η cache των πινάκων)· None = οι
+    αναστολές του RuleSet που ισχύει στην κατάθεση."""
+    name: str
+    exclusions: Optional[ExclusionBuilder] = None
+
+def make_exclusions(august: Callable[[int], List[Period]] = august_suspension_periods,
+                    state: Callable[[int], List[Period]] = state_vacation_periods,
+                    extra: Sequence[Period] = ()) -> ExclusionBuilder:
+    """Παραλλαγή του build_exclusion_periods με άλλες περιόδους Αυγούστου/Δημοσίου και
+    επιπλέον κλεισίματα (π.χ. αποχή, έκτακτη αναστολή)."""
+    def build(ctx: RuleContext) -> List[Period]:
+        ex: List[Period] = []
+        y0 = ctx.filing_date.year
+        for y in (y0, y0+1, y0+2):
+            ex.extend(august(y))
+            if ctx.public_entity_party:
+                ex.extend(state(y))
+        ex.extend(extra)
+        return ex
+    return build
+
+CURRENT = Scenario("Ισχύον")
+
+class _OpenDays:
+    """Πίνακας «ανοιχτών» (μη εξαιρούμενων) ημερών για ένα εύρος ετών: η n-οστή ανοιχτή
+    ημέρα μετά από μια ημερομηνία βρίσκεται με δύο lookups αντί για βρόχο ημέρα-ημέρα."""
+
+    def __init__(self, periods: Sequence[Period], first_year: int, last_year: int):
+        self.lo = date(first_year, 1, 1).toordinal()
+        hi = date(last_year, 12, 31).toordinal()
+        closed = bytearray(hi - self.lo + 1)
+        for p in periods:
+            a = max(p.start.toordinal(), self.lo) - self.lo
+            b = min(p.end.toordinal(), hi) - self.lo
+            if a <= b:
+                closed[a:b+1] = b"\x01" * (b - a + 1)
+        self.open: List[int] = [self.lo + i for i, c in enumerate(closed) if not c]
+        # rank[i] = πλήθος ανοιχτών ημερών <= lo+i
+        self.rank: List[int] = []
+        n = 0
+        for c in closed:
+            n += not c
+            self.rank.append(n)
+
+    def add(self, start: int, days: int) -> int:
+        # Ίδια σημασιολογία με utils.daterange_excluding, σε ordinals
+        if days <= 0:
+            return start + 1
+        i = start - self.lo
+        r = self.rank[i] if 0 <= i < len(self.rank) else bisect_right(self.open, start)
+        return self.open[r + days - 1]
+
+@dataclass
+class ScenarioOutcome:
+    case_key: str
+    baseline: List[date]
+    deadlines: Dict[str, List[date]] = field(default_factory=dict)
+    deltas: Dict[str, List[int]] = field(default_factory=dict)  # ημέρες έναντι baseline, ανά βήμα
+
+    def moved(self) -> Dict[str, List[int]]:
+        """Μόνο τα σενάρια που μετακινούν τουλάχιστον μία προθεσμία."""
+        return {k: v for k, v in self.deltas.items() if any(v)}
+
+class ScenarioEngine:
+    """Αξιολογεί ένα docket απέναντι σε K σενάρια σε ένα πέρασμα: οι πίνακες ανοιχτών ημερών
+    χτίζονται μία φορά ανά (σενάριο, έτος κατάθεσης, Δημόσιο) και κάθε βήμα είναι O(1)."""
+
+    SPAN_YEARS = 4  # το build_exclusion_periods καλύπτει y0..y0+2· +1 έτος περιθώριο μέτρησης
+
+    def __init__(self, scenarios: Sequence[Scenario], baseline: Scenario = CURRENT):
+        names = [baseline.name] + [s.name for s in scenarios]
+        if len(set(names)) != len(names):
+            raise ValueError("Scenario names must be unique (including the baseline)")
+        self.baseline = baseline
+        self.scenarios = list(scenarios)
+        self._tables: Dict[Tuple[int, RuleSet, int, bool], _OpenDays] = {}
+
+    def _table(self, idx: int, scenario: Scenario, rules: RuleSet, ctx: RuleContext) -> _OpenDays:
+        y0 = ctx.filing_date.year
+        key = (idx, rules, y0, ctx.public_entity_party)  # όχι rules.name: δύο καθεστώτα μπορεί να έχουν ίδιο όνομα
+        t = self._tables.get(key)
+        if t is None:
+            periods = scenario.exclusions(ctx) if scenario.exclusions else rules.exclusions(ctx)
+            t = _OpenDays(periods, y0, y0 + self.SPAN_YEARS)
+            self._tables[key] = t
+        return t
+
+    def _run(self, table: _OpenDays, rules: RuleSet, ctx: RuleContext) -> List[date]:
+        ends = [ctx.filing_date.toordinal()]
+        out: List[date] = []
+        for spec in rules.steps(ctx.procedure):
+            end = table.add(ends[spec.anchor], spec.days_for(ctx))
+            ends.append(end)
+            # Μεταφορά Σ/Κ όπως στο utils.carry_weekend_forward (ordinal 7 ≡ Κυριακή)
+            wd = end % 7
+            out.append(date.fromordinal(end + (2 if wd == 6 else 1 if wd == 0 else 0)))
+        return out
+
+    def baseline_for(self, ctx: RuleContext) -> List[date]:
+        """Οι (μεταφερμένες) προθεσμίες του baseline για μία υπόθεση."""
+        rules = rule_set_for(ctx.filing_date)
+        return self._run(self._table(0, self.baseline, rules, ctx), rules, ctx)
+
+    def evaluate(self, cases: Iterable[Tuple[str, RuleContext]]) -> List[ScenarioOutcome]:
+        results: List[ScenarioOutcome] = []
+        all_scenarios = [self.baseline] + self.scenarios
+        for case_key, ctx in cases:
+            rules = rule_set_for(ctx.filing_date)
+            per = [self._run(self._table(i, s, rules, ctx), rules, ctx) for i, s in enumerate(all_scenarios)]
+            base = per[0]
+            out = ScenarioOutcome(case_key, base)
+            for s, dates in zip(self.scenarios, per[1:]):
+                out.deadlines[s.name] = dates
+                out.deltas[s.name] = [(d - b).days for d, b in zip(dates, base)]
+            results.append(out)
+        return results
+
+def evaluate_scenarios(cases: Iterable[Tuple[str, RuleContext]], scenarios: Sequence[Scenario],
+                       baseline: Optional[Scenario] = None) -> List[ScenarioOutcome]:
+    return ScenarioEngine(scenarios, baseline or CURRENT).evaluate(cases)
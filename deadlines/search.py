@@ -0,0 +1,227 @@
+from __future__ import annotations
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from itertools import product
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+# -----------------------------
+# Κανονικοποίηση: ελληνικά & greeklish → κοινή λατινική «σκελετική» μορφή
+# -----------------------------
+_GREEK_DIGRAPHS = [
+    ("ου", "u"), ("αυ", "av"), ("ευ", "ev"), ("ει", "i"), ("οι", "i"), ("υι", "i"), ("αι", "e"),
+    ("μπ", "b"), ("ντ", "d"), ("γκ", "g"), ("γγ", "g"), ("τσ", "ts"), ("τζ", "tz"),
+]
+_GREEK_LETTERS = {
+    "α": "a", "β": "v", "γ": "g", "δ": "d", "ε": "e", "ζ": "z", "η": "i", "θ": "th",
+    "ι": "i", "κ": "k", "λ": "l", "μ": "m", "ν": "n", "ξ": "ks", "ο": "o", "π": "p",
+    "ρ": "r", "σ": "s", "ς": "s", "τ": "t", "υ": "i", "φ": "f", "χ": "h", "ψ": "ps", "ω": "o",
+}
+# Συνήθεις γραφές greeklish (εφαρμόζονται και στα ελληνικά μετά τη μεταγραφή)
+_LATIN_FOLDS = [
+    ("ou", "u"), ("oy", "u"), ("ey", "ev"), ("ay", "av"), ("eu", "ev"), ("au", "av"),
+    ("ef", "ev"), ("af", "av"), ("ei", "i"), ("oi", "i"), ("ai", "e"),
+    ("mp", "b"), ("nt", "d"), ("gk", "g"), ("gg", "g"), ("ng", "g"),  # ELOT: γγ/γκ → ng
+    ("ch", "h"), ("kh", "h"), ("8", "th"), ("x", "ks"), ("y", "i"), ("w", "o"), ("ph", "f"),
+]
+_DOUBLE = re.compile(r"([^\W\d_])\1+")
+_TOKEN = re.compile(r"[^\W_]+")
+
+# Τελευταίο γράμμα ερωτήματος που μπορεί να είναι μισό δίψηφο (π.χ. «Παπαδόπο|υλος»)
+_PARTIAL_TAIL = {"o": "ui", "e": "i", "a": "e", "m": "b", "n": "dg", "k": "h", "c": "h", "g": "i"}
+# Στα greeklish το «x» γράφεται και για ξ και για χ: ευρετήριο και ερώτημα κρατούν και τις δύο αναγνώσεις
+_X_READINGS = ("ks", "h")
+_X_MAX = 3  # πάνω από τόσα «x» σε ένα token δοκιμάζεται μόνο ίδια ανάγνωση για όλα
+
+def strip_accents(text: str) -> str:
+    """Αφαιρεί τόνους/διαλυτικά, casefold και τελικό σίγμα → σ."""
+    decomposed = unicodedata.normalize("NFD", text)
+    bare = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return bare.casefold().replace("ς", "σ")
+
+def fold_token(token: str) -> str:
+    t = strip_accents(token)
+    for gr, lat in _GREEK_DIGRAPHS:
+        t = t.replace(gr, lat)
+    t = "".join(_GREEK_LETTERS.get(ch, ch) for ch in t)
+    for src, dst in _LATIN_FOLDS:
+        t = t.replace(src, dst)
+    return _DOUBLE.sub(r"\1", t)
+
+def tokenize(text: str) -> List[str]:
+    return [fold_token(t) for t in _TOKEN.findall(text or "")]
+
+def index_tokens(text: str) -> Set[str]:
+    """Tokens προς ευρετηρίαση· ένα «x» μπαίνει και με τις δύο αναγνώσεις (ξ/χ), όπως στο ερώτημα."""
+    return {fold_token(r) for t in _TOKEN.findall(text or "") for r in _x_readings(t)}
+
+def _x_readings(token: str) -> List[str]:
+    parts = strip_accents(token).split("x")
+    n = len(parts) - 1
+    if not n:
+        return [token]
+    combos = product(_X_READINGS, repeat=n) if n <= _X_MAX else ((r,) * n for r in _X_READINGS)
+    out = []
+    for combo in combos:
+        out.append("".join(p + r for p, r in zip(parts, combo)) + parts[-1])
+    return out
+
+class CaseSearchIndex:
+    """Ανεστραμμένο ευρετήριο (token → case keys) πάνω σε πελάτη/αντίδικο.
+
+    Αναζήτηση με προθέματα και πολλά tokens (AND), ανεξάρτητα από τόνους/κεφαλαία και
+    γραφή (ελληνικά ή greeklish). Ενημερώνεται σταδιακά με upsert/remove.
+    """
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+        self._tokens: List[str] = []  # ταξινομημένα, για αναζήτηση προθέματος με bisect
+        self._doc_tokens: Dict[str, Set[str]] = {}
+        self.docs: Dict[str, dict] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def upsert(self, case_key: str, client: str, opponent: str, **meta) -> None:
+        tokens = index_tokens(client) | index_tokens(opponent)
+        with self._lock:
+            self._drop(case_key)
+            self.docs[case_key] = {"case_key": case_key, "client": client, "opponent": opponent, **meta}
+            self._doc_tokens[case_key] = tokens
+            for t in tokens:
+                posting = self._postings.get(t)
+                if posting is None:
+                    posting = self._postings[t] = set()
+                    insort(self._tokens, t)
+                posting.add(case_key)
+
+    def remove(self, case_key: str) -> None:
+        with self._lock:
+            self._drop(case_key)
+            self.docs.pop(case_key, None)
+
+    def _drop(self, case_key: str) -> None:
+        for t in self._doc_tokens.pop(case_key, ()):
+            posting = self._postings[t]
+            posting.discard(case_key)
+            if not posting:
+                del self._postings[t]
+                del self._tokens[bisect_left(self._tokens, t)]
+
+    def _range(self, prefix: str) -> Tuple[int, int]:
+        lo = bisect_left(self._tokens, prefix)
+        return lo, bisect_left(self._tokens, prefix + "\U0010ffff", lo)
+
+    def _cost(self, ranges: List[Tuple[int, int]], bound: float) -> float:
+        """Πλήθος εγγραφών που καλύπτουν τα ranges (σταματά μόλις ξεπεράσει το bound)."""
+        total = 0
+        for lo, hi in ranges:
+            for t in self._tokens[lo:hi]:
+                total += len(self._postings[t])
+                if total > bound:
+                    return total
+        return total
+
+    def _query_terms(self, query: str) -> List[Tuple[str, ...]]:
+        """Κάθε token του ερωτήματος → εναλλακτικά προθέματα (ταιριάζει αν ισχύει ένα από αυτά)."""
+        raw = _TOKEN.findall(query or "")
+        terms: List[Tuple[str, ...]] = []
+        for n, tok in enumerate(raw):
+            tail = strip_accents(tok)[-1:]
+            latin_tail = _GREEK_LETTERS.get(tail, tail)[-1:]
+            variants: Set[str] = set()
+            for reading in _x_readings(tok):
+                folded = fold_token(reading)
+                variants.add(folded)
+                if n == len(raw) - 1:
+                    # το τελευταίο token μπορεί να κόβεται στη μέση ενός δίψηφου («Παπαδόπο|υλος»)
+                    variants |= {folded[:-1] + alt for alt in _PARTIAL_TAIL.get(latin_tail, "")}
+            terms.append(tuple(sorted(variants)))
+        return terms
+
+    def search(self, query: str, limit: Optional[int] = 20) -> List[dict]:
+        """Υποθέσεις που ταιριάζουν σε ΟΛΑ τα tokens του ερωτήματος (ως προθέματα)."""
+        terms = self._query_terms(query)
+        if not terms:
+            return []
+        with self._lock:
+            # Οδηγός: το πιο επιλεκτικό token· τα υπόλοιπα ελέγχονται στα λίγα tokens κάθε υπόθεσης
+            ranges = [[self._range(v) for v in variants] for variants in terms]
+            best, best_cost = 0, float("inf")
+            for i, rs in enumerate(ranges):
+                cost = self._cost(rs, best_cost)
+                if cost < best_cost:
+                    best, best_cost = i, cost
+            if not best_cost:
+                return []
+            others = terms[:best] + terms[best + 1:]
+            seen: Set[str] = set()
+            out: List[dict] = []
+            for lo, hi in ranges[best]:
+                for t in self._tokens[lo:hi]:
+                    for key in self._postings[t]:
+                        if key in seen:
+                            continue
+                        seen.add(key)
+                        doc_tokens = self._doc_tokens[key]
+                        if all(any(dt.startswith(terms_v) for dt in doc_tokens) for terms_v in others):
+                            out.append(self.docs[key])
+                            if limit and len(out) >= limit:
+                                return out
+            return out
+
+    # -----------------------------
+    # Σύνδεση με CaseStore
+    # -----------------------------
+    def load(self, summaries: Iterable[Mapping[str, str]]) -> None:
+        for s in summaries:
+            self.upsert(**s)
+
+    def refresh(self, summaries_by_key: Mapping[str, Optional[Mapping[str, str]]]) -> None:
+        """Εφαρμόζει αλλαγές: None = η υπόθεση διαγράφηκε."""
+        for key, s in summaries_by_key.items():
+            if s is None:
+                self.remove(key)
+            else:
+                self.upsert(**s)
+
+class StoreCaseIndex(CaseSearchIndex):
+    """CaseSearchIndex που ακολουθεί ένα CaseStore: αλλαγές της ίδιας διεργασίας μέσω subscribe,
+    αλλαγών άλλων διεργασιών (π.χ. workers) από το ημερολόγιο αλλαγών πριν από κάθε αναζήτηση,
+    το πολύ μία φορά ανά `sync_interval` δευτερόλεπτα."""
+
+    def __init__(self, store, sync_interval: float = 1.0) -> None:
+        super().__init__()
+        self.store, self.sync_interval = store, sync_interval
+        self._seq = store.change_seq()
+        self._checked = time.monotonic()
+        self.load(store.case_summaries())
+        store.subscribe(self._apply)
+
+    def _apply(self, keys: List[str]) -> None:
+        found = {s["case_key"]: s for s in self.store.case_summaries(keys)}
+        self.refresh({k: found.get(k) for k in keys})
+
+    def sync(self, force: bool = False) -> None:
+        if not force and time.monotonic() - self._checked < self.sync_interval:
+            return
+        with self._lock:
+            self._checked = time.monotonic()
+            seq, keys = self.store.changes_since(self._seq)
+            if keys is None:  # πολύ πίσω: πλήρες ξαναχτίσιμο
+                self._postings, self._tokens, self._doc_tokens, self.docs = {}, [], {}, {}
+                self.load(self.store.case_summaries())
+            elif keys:
+                self._apply(keys)
+            self._seq = seq
+
+    def search(self, query: str, limit: Optional[int] = 20) -> List[dict]:
+        self.sync()
+        return super().search(query, limit)
+
+def attach_to_store(store, sync_interval: float = 1.0) -> StoreCaseIndex:
+    """Γεμίζει το ευρετήριο από το CaseStore και το κρατά ενημερωμένο (και από άλλους workers)."""
+    return StoreCaseIndex(store, sync_interval)
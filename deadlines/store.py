@@ -0,0 +1,315 @@
+from __future__ import annotations
+import os
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .calculators import DeadlineItem
+from .rules import RuleContext
+from .search import strip_accents
+from .utils import day_format, parse_iso_date
+
+DEFAULT_DB_PATH = os.environ.get(
+    "DEADLINES_DB_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(__file__)), "data", "cases.sqlite3"),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cases (
+    case_key    TEXT PRIMARY KEY,
+    client      TEXT NOT NULL DEFAULT '',
+    opponent    TEXT NOT NULL DEFAULT '',
+    filing_date TEXT NOT NULL,
+    procedure   TEXT NOT NULL,
+    abroad      INTEGER NOT NULL,
+    public      INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_cases_client ON cases(client);
+CREATE INDEX IF NOT EXISTS ix_cases_procedure ON cases(procedure, filing_date);
+
+CREATE TABLE IF NOT EXISTS deadlines (
+    case_key    TEXT NOT NULL REFERENCES cases(case_key) ON DELETE CASCADE,
+    step        INTEGER NOT NULL,
+    action      TEXT NOT NULL,
+    legal_basis TEXT NOT NULL,
+    deadline    TEXT NOT NULL,
+    weekday     TEXT NOT NULL,
+    note        TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (case_key, step)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_deadlines_deadline ON deadlines(deadline);
+CREATE INDEX IF NOT EXISTS ix_deadlines_step ON deadlines(step, deadline);
+
+-- Ημερολόγιο αλλαγών: άλλες διεργασίες (workers, scheduler) βλέπουν τι άλλαξε με polling
+CREATE TABLE IF NOT EXISTS case_changes (
+    seq      INTEGER PRIMARY KEY AUTOINCREMENT,
+    case_key TEXT NOT NULL
+);
+
+-- Υπενθυμίσεις που έχουν σταλεί (ώστε restart/αλλαγή worker να μην τις ξαναστείλει)
+CREATE TABLE IF NOT EXISTS reminders_sent (
+    case_key TEXT NOT NULL,
+    step     INTEGER NOT NULL,
+    deadline TEXT NOT NULL,
+    PRIMARY KEY (case_key, step, deadline)
+) WITHOUT ROWID;
+"""
+CHANGE_LOG_KEEP = 10000  # τόσες πρόσφατες αλλαγές κρατιούνται· όποιος μείνει πιο πίσω ξαναφορτώνει
+
+# Στήλες docket (όνομα στο UI -> έκφραση SQL) — λευκή λίστα για ταξινόμηση/φίλτρα
+DOCKET_COLUMNS = {
+    "client": "c.client",
+    "opponent": "c.opponent",
+    "procedure": "c.procedure",
+    "filing_date": "c.filing_date",
+    "step": "d.step",
+    "action": "d.action",
+    "legal_basis": "d.legal_basis",
+    "deadline": "d.deadline",
+    "weekday": "d.weekday",
+}
+# Τελεστής φίλτρου -> κατηγόρημα SQL. Το LIKE του SQLite αγνοεί κεφαλαία μόνο για ASCII, οπότε
+# τα case-insensitive φίλτρα συγκρίνουν μέσω της fold_text (casefold + χωρίς τόνους, βλ. _connect).
+DOCKET_OPERATORS = {
+    "=": "{col} = ?", "!=": "{col} != ?", "<": "{col} < ?", "<=": "{col} <= ?", ">": "{col} > ?", ">=": "{col} >= ?",
+    "i=": "fold_text({col}) = ?",
+    "contains": "instr(fold_text({col}), ?) > 0",
+    "scontains": "instr({col}, ?) > 0",
+}
+_FOLDED_OPERATORS = {"i=", "contains"}
+
+def fold_text(value: object) -> Optional[str]:
+    return None if value is None else strip_accents(str(value))
+
+@dataclass
+class CaseRecord:
+    case_key: str
+    ctx: RuleContext
+    client: str = ""
+    opponent: str = ""
+    items: List[DeadlineItem] = field(default_factory=list)
+
+def make_case_key(client: str, opponent: str, ctx: RuleContext) -> str:
+    return f"{client.strip()}|{opponent.strip()}|{ctx.filing_date.isoformat()}|{ctx.procedure}"
+
+def _item_from_row(r: sqlite3.Row) -> DeadlineItem:
+    return DeadlineItem(r["step"], r["action"], r["legal_basis"], parse_iso_date(r["deadline"]), r["weekday"], r["note"])
+
+def _ctx_from_row(r: sqlite3.Row) -> RuleContext:
+    return RuleContext(parse_iso_date(r["filing_date"]), bool(r["abroad"]), bool(r["public"]), r["procedure"])
+
+def _select_by_keys(conn: sqlite3.Connection, sql: str, case_keys: Optional[Iterable[str]],
+                    chunk_size: int = 500) -> List[sqlite3.Row]:
+    """`sql` για όλες τις γραμμές (None) ή μόνο για τα case_keys, σε κομμάτια λόγω ορίου παραμέτρων του SQLite."""
+    if case_keys is None:
+        return conn.execute(sql).fetchall()
+    keys = list(case_keys)
+    rows: List[sqlite3.Row] = []
+    for i in range(0, len(keys), chunk_size):
+        chunk = keys[i:i + chunk_size]
+        rows += conn.execute(f"{sql} WHERE case_key IN ({','.join('?' * len(chunk))})", chunk).fetchall()
+    return rows
+
+class CaseStore:
+    """Αποθήκη υποθέσεων & προθεσμιών σε SQLite (κοινή για UI και batch εργαλεία)."""
+
+    def __init__(self, path: str = DEFAULT_DB_PATH):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._memory_conn: Optional[sqlite3.Connection] = None
+        self._listeners: List[Callable[[List[str]], None]] = []
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def subscribe(self, listener: Callable[[List[str]], None]) -> None:
+        """Καλείται με τα case_key που άλλαξαν/διαγράφηκαν μετά από κάθε commit."""
+        self._listeners.append(listener)
+
+    def _notify(self, case_keys: List[str]) -> None:
+        for fn in list(self._listeners):
+            fn(case_keys)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # ":memory:" κρατά μία σύνδεση, αλλιώς θα χανόταν η βάση μετά από κάθε κλήση
+        if self.path == ":memory:":
+            if self._memory_conn is None:
+                self._memory_conn = sqlite3.connect(":memory:", check_same_thread=False)
+                self._memory_conn.row_factory = sqlite3.Row
+                self._memory_conn.create_function("fold_text", 1, fold_text, deterministic=True)
+                self._memory_conn.execute("PRAGMA foreign_keys=ON")
+            yield self._memory_conn
+            return
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.create_function("fold_text", 1, fold_text, deterministic=True)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            yield conn
+        finally:
+            conn.close()
+
+    # -----------------------------
+    # Εγγραφή
+    # -----------------------------
+    def upsert_cases(self, records: Iterable[CaseRecord]) -> int:
+        """Bulk upsert σε μία συναλλαγή· οι προθεσμίες κάθε υπόθεσης αντικαθίστανται πλήρως."""
+        case_rows: List[tuple] = []
+        item_rows: List[tuple] = []
+        for rec in records:
+            c = rec.ctx
+            case_rows.append((rec.case_key, rec.client, rec.opponent, day_format(c.filing_date).iso,
+                              c.procedure, int(c.defendant_abroad_or_unknown), int(c.public_entity_party)))
+            for it in rec.items:
+                item_rows.append((rec.case_key, it.step, it.action, it.legal_basis,
+                                  day_format(it.deadline).iso, it.weekday, it.note or ""))
+        if not case_rows:
+            return 0
+        with self._connect() as conn, conn:
+            conn.executemany(
+                "INSERT INTO cases(case_key, client, opponent, filing_date, procedure, abroad, public) "
+                "VALUES (?,?,?,?,?,?,?) ON CONFLICT(case_key) DO UPDATE SET "
+                "client=excluded.client, opponent=excluded.opponent, filing_date=excluded.filing_date, "
+                "procedure=excluded.procedure, abroad=excluded.abroad, public=excluded.public",
+                case_rows,
+            )
+            conn.executemany("DELETE FROM deadlines WHERE case_key = ?", [(r[0],) for r in case_rows])
+            conn.executemany(
+                "INSERT INTO deadlines(case_key, step, action, legal_basis, deadline, weekday, note) "
+                "VALUES (?,?,?,?,?,?,?)",
+                item_rows,
+            )
+            self._log_changes(conn, [r[0] for r in case_rows])
+        self._notify([r[0] for r in case_rows])
+        return len(case_rows)
+
+    def delete_case(self, case_key: str) -> None:
+        with self._connect() as conn, conn:
+            conn.execute("DELETE FROM cases WHERE case_key = ?", (case_key,))
+            self._log_changes(conn, [case_key])
+        self._notify([case_key])
+
+    @staticmethod
+    def _log_changes(conn: sqlite3.Connection, case_keys: List[str]) -> None:
+        conn.executemany("INSERT INTO case_changes(case_key) VALUES (?)", [(k,) for k in case_keys])
+        conn.execute("DELETE FROM case_changes WHERE seq <= (SELECT MAX(seq) FROM case_changes) - ?",
+                     (CHANGE_LOG_KEEP,))
+
+    def change_seq(self) -> int:
+        """Αύξων αριθμός της τελευταίας αλλαγής (από οποιαδήποτε διεργασία)."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COALESCE(MAX(seq), 0) FROM case_changes").fetchone()[0]
+
+    def changes_since(self, seq: int) -> Tuple[int, Optional[List[str]]]:
+        """(τελευταίο seq, case_key που άλλαξαν μετά το `seq`)· None αν το ημερολόγιο
+        έχει ήδη κλαδευτεί πέρα από το `seq` (ο καλών πρέπει να ξαναφορτώσει τα πάντα)."""
+        with self._connect() as conn:
+            lo, hi = conn.execute("SELECT MIN(seq), MAX(seq) FROM case_changes").fetchone()
+            if hi is None or hi <= seq:
+                return max(seq, hi or 0), []
+            if lo > seq + 1:
+                return hi, None
+            rows = conn.execute("SELECT DISTINCT case_key FROM case_changes WHERE seq > ? AND seq <= ?", (seq, hi))
+            return hi, [r[0] for r in rows]
+
+    def mark_reminded(self, sent: Iterable[Tuple[str, int, date]]) -> None:
+        """Καταγράφει σταλμένες υπενθυμίσεις· όσες αφορούν ληγμένες προθεσμίες διαγράφονται."""
+        rows = [(k, step, day_format(d).iso) for k, step, d in sent]
+        with self._connect() as conn, conn:
+            conn.executemany("INSERT OR IGNORE INTO reminders_sent(case_key, step, deadline) VALUES (?,?,?)", rows)
+            conn.execute("DELETE FROM reminders_sent WHERE deadline < ?", (day_format(date.today()).iso,))
+
+    def reminded(self, case_keys: Optional[Sequence[str]] = None) -> Set[Tuple[str, int, date]]:
+        """(case_key, step, deadline) των υπενθυμίσεων που έχουν ήδη σταλεί."""
+        sql = "SELECT case_key, step, deadline FROM reminders_sent"
+        with self._connect() as conn:
+            rows = _select_by_keys(conn, sql, case_keys)
+        return {(r[0], r[1], parse_iso_date(r[2])) for r in rows}
+
+    # -----------------------------
+    # Ερωτήματα
+    # -----------------------------
+    def _load(self, conn: sqlite3.Connection, where: str, params: tuple) -> List[CaseRecord]:
+        cases = conn.execute(f"SELECT * FROM cases WHERE {where} ORDER BY filing_date, case_key", params).fetchall()
+        out = {r["case_key"]: CaseRecord(r["case_key"], _ctx_from_row(r), r["client"], r["opponent"]) for r in cases}
+        if not out:
+            return []
+        items = conn.execute(
+            f"SELECT d.* FROM deadlines d JOIN cases USING(case_key) WHERE {where} ORDER BY d.case_key, d.step",
+            params,
+        )
+        for r in items:
+            out[r["case_key"]].items.append(_item_from_row(r))
+        return list(out.values())
+
+    def get_case(self, case_key: str) -> Optional[CaseRecord]:
+        with self._connect() as conn:
+            found = self._load(conn, "case_key = ?", (case_key,))
+        return found[0] if found else None
+
+    def cases_by_client(self, client: str) -> List[CaseRecord]:
+        with self._connect() as conn:
+            return self._load(conn, "client = ?", (client,))
+
+    def cases_by_procedure(self, procedure: str, filed_from: Optional[date] = None,
+                           filed_to: Optional[date] = None) -> List[CaseRecord]:
+        lo = (filed_from or date.min).isoformat()
+        hi = (filed_to or date.max).isoformat()
+        with self._connect() as conn:
+            return self._load(conn, "procedure = ? AND filing_date BETWEEN ? AND ?", (procedure, lo, hi))
+
+    def deadlines_between(self, start: date, end: date, step: Optional[int] = None) -> List[Tuple[str, DeadlineItem]]:
+        """Προθεσμίες που λήγουν στο [start, end], ταξινομημένες κατά ημερομηνία."""
+        sql = "SELECT * FROM deadlines WHERE deadline BETWEEN ? AND ?"
+        params: tuple = (start.isoformat(), end.isoformat())
+        if step is not None:
+            sql = "SELECT * FROM deadlines WHERE step = ? AND deadline BETWEEN ? AND ?"
+            params = (step,) + params
+        with self._connect() as conn:
+            rows = conn.execute(sql + " ORDER BY deadline, case_key, step", params).fetchall()
+        return [(r["case_key"], _item_from_row(r)) for r in rows]
+
+    def case_summaries(self, case_keys: Optional[Sequence[str]] = None) -> List[dict]:
+        """Ελαφριά λίστα υποθέσεων (χωρίς προθεσμίες), π.χ. για το ευρετήριο αναζήτησης."""
+        sql = "SELECT case_key, client, opponent, filing_date, procedure FROM cases"
+        with self._connect() as conn:
+            return [dict(r) for r in _select_by_keys(conn, sql, case_keys)]
+
+    def count_cases(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM cases").fetchone()[0]
+
+    def docket_page(self, offset: int, limit: int,
+                    sort: Sequence[Tuple[str, bool]] = (),
+                    filters: Sequence[Tuple[str, str, object]] = ()) -> Tuple[List[dict], int]:
+        """Μία σελίδα του docket (όλες οι προθεσμίες όλων των υποθέσεων) και το συνολικό πλήθος.
+
+        `sort`: [(στήλη, ascending)], `filters`: [(στήλη, τελεστής, τιμή)] με στήλες από
+        DOCKET_COLUMNS και τελεστές από DOCKET_OPERATORS· ό,τι άγνωστο αγνοείται.
+        """
+        where: List[str] = []
+        params: List[object] = []
+        for col, op, value in filters:
+            if col not in DOCKET_COLUMNS or op not in DOCKET_OPERATORS:
+                continue
+            if op in _FOLDED_OPERATORS:
+                value = fold_text(value)
+            where.append(DOCKET_OPERATORS[op].format(col=DOCKET_COLUMNS[col]))
+            params.append(value)
+        where_sql = f" WHERE {' AND '.join(where)}" if where else ""
+        order = [f"{DOCKET_COLUMNS[col]} {'ASC' if asc else 'DESC'}" for col, asc in sort if col in DOCKET_COLUMNS]
+        order_sql = ", ".join(order + ["d.deadline", "d.case_key", "d.step"])
+        select = ", ".join(f"{expr} AS {name}" for name, expr in DOCKET_COLUMNS.items())
+        base = f"FROM deadlines d JOIN cases c USING(case_key){where_sql}"
+        with self._connect() as conn:
+            total = conn.execute(f"SELECT COUNT(*) {base}", params).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT d.case_key AS case_key, {select} {base} ORDER BY {order_sql} LIMIT ? OFFSET ?",
+                params + [max(limit, 0), max(offset, 0)],
+            ).fetchall()
+        return [dict(r) for r in rows], total
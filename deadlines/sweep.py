@@ -0,0 +1,178 @@
+"""
+Διαφορικός έλεγχος υλοποιήσεων υπολογισμού προθεσμιών.
+
+Τρέχει κάθε ημερομηνία κατάθεσης ενός εύρους (προεπιλογή: έναν αιώνα) για όλους τους
+συνδυασμούς εξωτερικού/Δημοσίου/διαδικασίας μέσα από κάθε engine, μετρά χρόνο ανά engine
+και αναφέρει τις πρώτες αποκλίσεις ανά βήμα έναντι του πρώτου engine (reference).
+
+Το εύρος σπάει σε κομμάτια (--chunk-days) που τρέχουν παράλληλα σε --jobs διεργασίες·
+κάθε κομμάτι συγκρίνεται αμέσως, οπότε στη μνήμη μένουν μόνο τα αποτελέσματα ενός κομματιού.
+
+    python -m deadlines.sweep --start 1950-01-01 --years 100 --engines batch,scalar,legacy --jobs 8
+"""
+from __future__ import annotations
+import argparse
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from itertools import product, zip_longest
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .calculators import DeadlineCalculator
+from .rules import RuleContext
+from .scenarios import ScenarioEngine
+
+Engine = Callable[[Sequence[RuleContext]], List[List[date]]]
+
+def scalar_engine(ctxs: Sequence[RuleContext]) -> List[List[date]]:
+    return [[it.deadline for it in DeadlineCalculator(c).compute()] for c in ctxs]
+
+def legacy_engine(ctxs: Sequence[RuleContext]) -> List[List[date]]:
+    # deadlines.deadlines.rules: παλαιότερη υλοποίηση (διαφορετικό anchor στο βήμα 5 κ.ά.)
+    from .deadlines import rules as legacy
+    out = []
+    for c in ctxs:
+        lc = legacy.RuleContext(c.filing_date, c.defendant_abroad_or_unknown, c.public_entity_party, c.procedure)
+        out.append([it.deadline for it in legacy.DeadlineCalculator(lc).compute()])
+    return out
+
+def batch_engine(ctxs: Sequence[RuleContext]) -> List[List[date]]:
+    engine = ScenarioEngine([])
+    return [engine.baseline_for(c) for c in ctxs]
+
+ENGINES: Dict[str, Engine] = {
+    "scalar": scalar_engine,
+    "legacy": legacy_engine,
+    "batch": batch_engine,
+}
+
+def iter_contexts(start: date, end: date) -> Iterator[RuleContext]:
+    d = start
+    while d <= end:
+        for abroad, public, procedure in product((False, True), (False, True), ("regular", "small_claims")):
+            yield RuleContext(d, abroad, public, procedure)
+        d += timedelta(days=1)
+
+@dataclass
+class Divergence:
+    ctx: RuleContext
+    step: int
+    expected: Optional[date]  # None: το engine δεν έβγαλε αυτό το βήμα (διαφορετικό πλήθος βημάτων)
+    got: Optional[date]
+
+@dataclass
+class SweepReport:
+    cases: int = 0
+    wall: float = 0.0
+    # engine -> δευτερόλεπτα CPU (άθροισμα όλων των κομματιών)
+    timings: Dict[str, float] = field(default_factory=dict)
+    # engine -> step -> (πλήθος αποκλίσεων, πρώτες αποκλίσεις)
+    divergences: Dict[str, Dict[int, Tuple[int, List[Divergence]]]] = field(default_factory=dict)
+
+    def merge(self, other: "SweepReport", first_n: int) -> None:
+        self.cases += other.cases
+        for name, secs in other.timings.items():
+            self.timings[name] = self.timings.get(name, 0.0) + secs
+        for name, per_step in other.divergences.items():
+            mine = self.divergences.setdefault(name, {})
+            for s, (n, first) in per_step.items():
+                m, kept = mine.get(s, (0, []))
+                mine[s] = (m + n, (kept + first)[:first_n])
+
+def _sweep_chunk(args: Tuple[date, date, Tuple[str, ...], int]) -> SweepReport:
+    start, end, engines, first_n = args
+    ctxs = list(iter_contexts(start, end))
+    report = SweepReport(len(ctxs))
+    results: Dict[str, List[List[date]]] = {}
+    for name in engines:
+        t0 = time.perf_counter()
+        results[name] = ENGINES[name](ctxs)
+        report.timings[name] = time.perf_counter() - t0
+        if len(results[name]) != len(ctxs):
+            raise RuntimeError(f"Engine {name!r} returned {len(results[name])} results for {len(ctxs)} contexts")
+
+    ref = results[engines[0]]
+    for name in engines[1:]:
+        per_step: Dict[int, Tuple[int, List[Divergence]]] = {}
+        for ctx, exp, got in zip(ctxs, ref, results[name]):
+            for s, (e, g) in enumerate(zip_longest(exp, got), start=1):
+                if e != g:
+                    n, first = per_step.get(s, (0, []))
+                    if len(first) < first_n:
+                        first.append(Divergence(ctx, s, e, g))
+                    per_step[s] = (n + 1, first)
+        report.divergences[name] = per_step
+    return report
+
+def _chunks(start: date, end: date, days: int) -> Iterator[Tuple[date, date]]:
+    while start <= end:
+        stop = min(end, start + timedelta(days=days - 1))
+        yield start, stop
+        start = stop + timedelta(days=1)
+
+def sweep(start: date, end: date, engines: Sequence[str], first_n: int = 3,
+          jobs: Optional[int] = None, chunk_days: int = 366) -> SweepReport:
+    if not engines:
+        raise ValueError("At least one engine is required")
+    jobs = jobs or os.cpu_count() or 1
+    tasks = [(a, b, tuple(engines), first_n) for a, b in _chunks(start, end, chunk_days)]
+    report = SweepReport(divergences={name: {} for name in engines[1:]})
+    t0 = time.perf_counter()
+    if jobs == 1 or len(tasks) == 1:
+        for part in map(_sweep_chunk, tasks):
+            report.merge(part, first_n)
+    else:
+        with Pool(min(jobs, len(tasks))) as pool:
+            # imap: με τη σειρά των ημερομηνιών, ώστε οι «πρώτες» αποκλίσεις να είναι οι πρώτες χρονικά
+            for part in pool.imap(_sweep_chunk, tasks):
+                report.merge(part, first_n)
+    report.wall = time.perf_counter() - t0
+    return report
+
+def _fmt(d: Optional[date]) -> str:
+    return "—" if d is None else f"{d:%d-%m-%Y}"
+
+def format_report(report: SweepReport, reference: str) -> str:
+    lines = [f"Περιπτώσεις: {report.cases} σε {report.wall:.2f} s"]
+    for name, secs in report.timings.items():
+        rate = report.cases / secs if secs else float("inf")
+        lines.append(f"  {name:<8} {secs:8.2f} s CPU  ({rate:,.0f} περιπτώσεις/s ανά διεργασία)")
+    for name, per_step in report.divergences.items():
+        if not per_step:
+            lines.append(f"{name} ≡ {reference}: καμία απόκλιση")
+            continue
+        lines.append(f"{name} vs {reference}:")
+        for s in sorted(per_step):
+            n, first = per_step[s]
+            lines.append(f"  βήμα {s}: {n} αποκλίσεις")
+            for dv in first:
+                c = dv.ctx
+                lines.append(f"    κατάθεση {c.filing_date:%d-%m-%Y} εξωτ.={int(c.defendant_abroad_or_unknown)} "
+                             f"Δημ.={int(c.public_entity_party)} {c.procedure}: "
+                             f"{_fmt(dv.expected)} ≠ {_fmt(dv.got)}")
+    return "\n".join(lines)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--start", type=date.fromisoformat, default=date(1950, 1, 1))
+    ap.add_argument("--years", type=int, default=100)
+    ap.add_argument("--engines", default="batch,scalar,legacy",
+                    help=f"λίστα με κόμμα· η πρώτη είναι το reference ({', '.join(ENGINES)})")
+    ap.add_argument("--first", type=int, default=3, help="πλήθος αποκλίσεων προς εμφάνιση ανά βήμα")
+    ap.add_argument("--jobs", type=int, default=None, help="παράλληλες διεργασίες (προεπιλογή: όλοι οι πυρήνες)")
+    ap.add_argument("--chunk-days", type=int, default=366, help="ημέρες κατάθεσης ανά κομμάτι")
+    args = ap.parse_args(argv)
+
+    engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+    unknown = [e for e in engines if e not in ENGINES]
+    if unknown:
+        ap.error(f"άγνωστα engines: {', '.join(unknown)}")
+    end = args.start + timedelta(days=round(365.2425 * args.years) - 1)
+    report = sweep(args.start, end, engines, args.first, args.jobs, args.chunk_days)
+    print(format_report(report, engines[0]))
+    return 1 if any(report.divergences.values()) else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,7 +2,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import List
+from typing import Dict, List, NamedTuple, Union
 
 GREEK_WEEKDAYS = {0:"Δευτέρα",1:"Τρίτη",2:"Τετάρτη",3:"Πέμπτη",4:"Παρασκευή",5:"Σάββατο",6:"Κυριακή"}
 
@@ -29,5 +29,47 @@ def carry_weekend_forward(d: date) -> date:
     if d.weekday() == 6: return d + timedelta(days=1)
     return d
 
+# -----------------------------
+# Κοινός πίνακας μορφοποίησης ημερών (UI, PDF, store, API)
+# -----------------------------
+class DayFormat(NamedTuple):
+    day: date
+    iso: str      # 2025-07-07
+    dmy: str      # 07-07-2025
+    weekday: str  # Δευτέρα
+    label: str    # Δευτέρα 07-07-2025
+
+_DAY_FORMATS: Dict[int, DayFormat] = {}  # date ordinal → DayFormat, γεμίζει ανά έτος
+
+def _fill_year(year: int) -> None:
+    d = date(year, 1, 1)
+    n = d.toordinal()
+    wd = d.weekday()
+    table: Dict[int, DayFormat] = {}
+    while d.year == year:
+        iso = f"{year:04d}-{d.month:02d}-{d.day:02d}"
+        dmy = f"{d.day:02d}-{d.month:02d}-{year:04d}"
+        name = GREEK_WEEKDAYS[wd]
+        table[n] = DayFormat(d, iso, dmy, name, f"{name} {dmy}")
+        n += 1
+        wd = (wd + 1) % 7
+        if d == date.max:
+            break
+        d += timedelta(days=1)
+    _DAY_FORMATS.update(table)
+
+def day_format(day: Union[date, int]) -> DayFormat:
+    """Έτοιμα strings μιας ημέρας (date ή date ordinal)· ο πίνακας χτίζεται lazy ανά έτος."""
+    n = day if isinstance(day, int) else day.toordinal()
+    f = _DAY_FORMATS.get(n)
+    if f is None:
+        _fill_year(date.fromordinal(n).year)
+        f = _DAY_FORMATS[n]
+    return f
+
+def parse_iso_date(s: str) -> date:
+    """'YYYY-MM-DD' (ή με ώρα, όπως το στέλνει ο DatePicker) → date, χωρίς strptime."""
+    return date.fromisoformat(s[:10])
+
 def greek_weekday(d: date) -> str:
-    return GREEK_WEEKDAYS[d.weekday()]
+    return day_format(d).weekday
@@ -0,0 +1,114 @@
+"""
+Προθέρμανση worker μετά από restart.
+
+Σε background thread υπολογίζει (και κρατά σε cache) τις προθεσμίες για κάθε εργάσιμη
+ημέρα κατάθεσης σε παράθυρο γύρω από σήμερα, για όλους τους συνδυασμούς
+εξωτερικού/Δημοσίου/διαδικασίας, και φορτώνει τη γραμματοσειρά του PDF στο reportlab.
+Ο worker δέχεται αιτήματα κανονικά όσο τρέχει· όποιο αποτέλεσμα δεν έχει ακόμη
+υπολογιστεί, υπολογίζεται (και μπαίνει στην cache) από το ίδιο το αίτημα.
+"""
+from __future__ import annotations
+import io
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import product
+from typing import Optional, Tuple
+
+from .calculators import DeadlineCalculator, DeadlineItem
+from .rules import RuleContext
+
+log = logging.getLogger(__name__)
+
+PROCEDURES = ("regular", "small_claims")
+COMBINATIONS = 8  # εξωτερικό × Δημόσιο × διαδικασία
+CACHE_HEADROOM = 4096  # για καταθέσεις εκτός παραθύρου (π.χ. παλιές υποθέσεις)
+CACHE_SIZE = 16384  # προεπιλογή χωρίς προθέρμανση (~±1400 ημέρες εργάσιμων × 8 συνδυασμοί)
+
+def _compute_uncached(filing_date: date, abroad: bool, public: bool, procedure: str) -> Tuple[DeadlineItem, ...]:
+    return tuple(DeadlineCalculator(RuleContext(filing_date, abroad, public, procedure)).compute())
+
+_compute = lru_cache(maxsize=CACHE_SIZE)(_compute_uncached)
+_resize_lock = threading.Lock()
+
+def cache_size_for(window_days: int) -> int:
+    """Θέσεις cache ώστε να χωρά όλο το παράθυρο ±window_days (εργάσιμες × συνδυασμοί + περιθώριο)."""
+    weekdays = (2 * window_days + 1) * 5 // 7 + 2
+    return weekdays * COMBINATIONS + CACHE_HEADROOM
+
+def ensure_capacity(window_days: int) -> int:
+    """Μεγαλώνει την cache (αν χρειάζεται) πριν την προθέρμανση, ώστε να μην εκτοπίζει ό,τι μόλις γέμισε."""
+    global _compute
+    needed = cache_size_for(window_days)
+    with _resize_lock:
+        if _compute.cache_info().maxsize < needed:
+            _compute = lru_cache(maxsize=needed)(_compute_uncached)
+        return _compute.cache_info().maxsize
+
+def compute_cached(ctx: RuleContext) -> Tuple[DeadlineItem, ...]:
+    """Ίδιο με DeadlineCalculator(ctx).compute(), αλλά από κοινή (thread-safe) cache."""
+    return _compute(ctx.filing_date, ctx.defendant_abroad_or_unknown, ctx.public_entity_party, ctx.procedure)
+
+@dataclass
+class WarmupReport:
+    window_days: int
+    contexts: int = 0
+    compute_seconds: float = 0.0
+    font_seconds: float = 0.0
+    font: str = ""
+    error: str = ""
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    def summary(self) -> str:
+        if self.error:
+            return f"Warm-up απέτυχε: {self.error}"
+        return (f"Warm-up: {self.contexts} υπολογισμοί (±{self.window_days} ημέρες) σε {self.compute_seconds:.2f}s, "
+                f"γραμματοσειρά {self.font} σε {self.font_seconds:.2f}s")
+
+def warm_deadlines(window_days: int = 365, today: Optional[date] = None) -> int:
+    """Γεμίζει την cache για κάθε εργάσιμη στο [today - window, today + window]."""
+    today = today or date.today()
+    ensure_capacity(window_days)
+    n = 0
+    d = today - timedelta(days=window_days)
+    end = today + timedelta(days=window_days)
+    while d <= end:
+        if d.weekday() < 5:
+            for abroad, public, procedure in product((False, True), (False, True), PROCEDURES):
+                _compute(d, abroad, public, procedure)
+                n += 1
+        d += timedelta(days=1)
+    return n
+
+def warm_pdf_font() -> str:
+    """Καταχωρεί την ελληνική γραμματοσειρά και αποδίδει ένα μικρό PDF (subsetting, imports)."""
+    from .pdf import _ensure_font, make_pdf
+    font = _ensure_font()
+    make_pdf(io.BytesIO(), "Warm-up", {}, list(compute_cached(RuleContext(date.today(), False, False, "regular"))))
+    return font
+
+def run(report: WarmupReport) -> WarmupReport:
+    try:
+        t0 = time.perf_counter()
+        report.contexts = warm_deadlines(report.window_days)
+        t1 = time.perf_counter()
+        report.compute_seconds = t1 - t0
+        report.font = warm_pdf_font()
+        report.font_seconds = time.perf_counter() - t1
+    except Exception as e:  # η προθέρμανση δεν πρέπει ποτέ να ρίξει τον worker
+        report.error = f"{type(e).__name__}: {e}"
+    finally:
+        report.done.set()
+    if report.error:
+        log.warning(report.summary())
+    else:
+        log.info(report.summary())
+    return report
+
+def start_in_background(window_days: int = 365) -> WarmupReport:
+    report = WarmupReport(window_days)
+    threading.Thread(target=run, args=(report,), name="deadline-warmup", daemon=True).start()
+    return report
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+"""
+Load test για το Dash app: N ταυτόχρονοι «χρήστες» καλούν το πραγματικό endpoint
+`_dash-update-component` (Υπολογισμός → άνοιγμα panels → PDF) και μετράμε
+throughput και p50/p95/p99 latency ανά callback.
+
+    python loadtest.py --users 20 --duration 60              # ξεκινά τοπικό server
+    python loadtest.py --url http://127.0.0.1:8050/ --users 50  # υπάρχων server (π.χ. gunicorn)
+
+Προσοχή: το export_pdf γράφει και στο ~/Downloads του server σε κάθε κλήση.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from datetime import date, timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# ==========================
+#  Payloads (ίδια μορφή με το dash-renderer)
+# ==========================
+def _prop(id_, prop, value=None):
+    return {"id": id_, "property": prop, "value": value}
+
+def compute_payload(filing: date, abroad: str, public: str, procedure: str) -> dict:
+    return {
+        "output": "..rows-store.data...meta-store.data...banner.children...filing-note.children..",
+        "outputs": [{"id":"rows-store","property":"data"}, {"id":"meta-store","property":"data"},
+                    {"id":"banner","property":"children"}, {"id":"filing-note","property":"children"}],
+        "inputs": [_prop("btn-compute", "n_clicks", 1)],
+        "changedPropIds": ["btn-compute.n_clicks"],
+        "state": [_prop("in-abroad", "value", abroad), _prop("in-public", "value", public),
+                  _prop("in-procedure", "value", procedure), _prop("in-filing-date", "date", filing.isoformat())],
+    }
+
+def render_payload(rows) -> dict:
+    return {
+        "output": "rows-container.children",
+        "outputs": {"id": "rows-container", "property": "children"},
+        "inputs": [_prop("rows-store", "data", rows)],
+        "changedPropIds": ["rows-store.data"],
+    }
+
+def toggle_payload(kind: str, index: int, n_clicks: int) -> dict:
+    btn = {"index": index, "type": f"{kind}-btn"}
+    return {
+        "output": '{"index":["MATCH"],"type":"%s-panel"}.style' % kind,
+        "outputs": {"id": {"index": index, "type": f"{kind}-panel"}, "property": "style"},
+        "inputs": [_prop(btn, "n_clicks", n_clicks)],
+        "changedPropIds": [json.dumps(btn, separators=(",", ":"), sort_keys=True) + ".n_clicks"],
+    }
+
+def pdf_payload(rows, meta, client: str, opponent: str) -> dict:
+    return {
+        "output": "..pdf-download.data...pdf-message.children..",
+        "outputs": [{"id":"pdf-download","property":"data"}, {"id":"pdf-message","property":"children"}],
+        "inputs": [_prop("btn-pdf", "n_clicks", 1)],
+        "changedPropIds": ["btn-pdf.n_clicks"],
+        "state": [_prop("rows-store", "data", rows), _prop("meta-store", "data", meta),
+                  _prop("in-client", "value", client), _prop("in-opponent", "value", opponent)],
+    }
+
+# ==========================
+#  Client
+# ==========================
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, name: str, secs: float, ok: bool):
+        with self.lock:
+            if ok:
+                self.latencies[name].append(secs)
+            else:
+                self.errors[name] += 1
+
+def post(endpoint: str, payload: dict, stats: Stats, name: str, timeout: float):
+    body = json.dumps(payload).encode("utf-8")
+    req = urllib.request.Request(endpoint, data=body, headers={"Content-Type": "application/json"}, method="POST")
+    t0 = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as r:
+            data = json.loads(r.read() or b"{}")
+        stats.record(name, time.perf_counter() - t0, True)
+        return data
+    except (urllib.error.URLError, OSError, ValueError):
+        stats.record(name, time.perf_counter() - t0, False)
+        return None
+
+def user_session(endpoint: str, stats: Stats, stop: threading.Event, seed: int, timeout: float):
+    rnd = random.Random(seed)
+    while not stop.is_set():
+        filing = date.today() + timedelta(days=rnd.randint(-365, 365))
+        data = post(endpoint, compute_payload(filing, rnd.choice(["no", "yes"]), rnd.choice(["no", "yes"]),
+                                              rnd.choice(["regular", "small_claims"])),
+                    stats, "compute_deadlines", timeout)
+        if not data:
+            continue
+        resp = data.get("response", {})
+        rows = resp.get("rows-store", {}).get("data") or []
+        meta = resp.get("meta-store", {}).get("data") or {}
+        # ο browser ζητά αμέσως την απόδοση των σειρών (αλυσιδωτό callback στο rows-store)
+        post(endpoint, render_payload(rows), stats, "render_rows", timeout)
+        for r in rows[:2]:
+            post(endpoint, toggle_payload("calc", r["idx"], 1), stats, "toggle_calc_panel", timeout)
+            post(endpoint, toggle_payload("law", r["idx"], 1), stats, "toggle_law_panel", timeout)
+        post(endpoint, pdf_payload(rows, meta, f"Πελάτης {seed}", "Αντίδικος"), stats, "export_pdf", timeout)
+
+# ==========================
+#  Server & report
+# ==========================
+def start_local_server(port: int, base_path: str) -> subprocess.Popen:
+    env = dict(os.environ, DEADLINES_BASE_PATH=base_path)
+    code = f"from app import app; app.run(host='127.0.0.1', port={port}, debug=False)"
+    return subprocess.Popen([sys.executable, "-c", code], cwd=HERE, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def wait_until_up(url: str, timeout: float = 60.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=2):
+                return
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.3)
+    raise RuntimeError(f"Server did not start at {url}")
+
+def percentile(sorted_vals, p: float) -> float:
+    if not sorted_vals:
+        return float("nan")
+    k = min(len(sorted_vals) - 1, max(0, math.ceil(p / 100.0 * len(sorted_vals)) - 1))  # nearest-rank
+    return sorted_vals[k]
+
+def report(stats: Stats, elapsed: float) -> str:
+    lines = [f"{'callback':<20}{'ok':>8}{'err':>6}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"]
+    for name in sorted(set(stats.latencies) | set(stats.errors)):
+        vals = sorted(stats.latencies[name])
+        lines.append(f"{name:<20}{len(vals):>8}{stats.errors[name]:>6}{len(vals)/elapsed:>9.1f}"
+                     f"{percentile(vals,50)*1000:>9.1f}{percentile(vals,95)*1000:>9.1f}{percentile(vals,99)*1000:>9.1f}")
+    total = sum(len(v) for v in stats.latencies.values())
+    lines.append(f"Σύνολο: {total} επιτυχή αιτήματα σε {elapsed:.1f}s ({total/elapsed:.1f} req/s)")
+    return "\n".join(lines)
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--url", help="βάση του app (με το DEADLINES_BASE_PATH)· αλλιώς ξεκινά τοπικός server")
+    ap.add_argument("--port", type=int, default=8051)
+    ap.add_argument("--users", type=int, default=10)
+    ap.add_argument("--duration", type=float, default=30.0, help="δευτερόλεπτα μέτρησης")
+    ap.add_argument("--timeout", type=float, default=30.0)
+    args = ap.parse_args(argv)
+
+    proc = None
+    base = args.url
+    if not base:
+        base = f"http://127.0.0.1:{args.port}/"
+        proc = start_local_server(args.port, "/")
+    base = base if base.endswith("/") else base + "/"
+    try:
+        wait_until_up(base)
+        endpoint = base + "_dash-update-component"
+        stats, stop = Stats(), threading.Event()
+        threads = [threading.Thread(target=user_session, args=(endpoint, stats, stop, i, args.timeout), daemon=True)
+                   for i in range(args.users)]
+        t0 = time.perf_counter()
+        for t in threads:
+            t.start()
+        time.sleep(args.duration)
+        stop.set()
+        for t in threads:
+            t.join(args.timeout)
+        print(report(stats, time.perf_counter() - t0))
+        return 1 if any(stats.errors.values()) else 0
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait(10)
+
+if __name__ == "__main__":
+    raise SystemExit(main())